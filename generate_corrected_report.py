@@ -3,14 +3,15 @@
 Generate corrected high-field HTS coil performance report.
 """
 
+import io
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-import json
 from datetime import datetime
 import numpy as np
 
 # Import modules
+from hts import _json
 from hts.high_field_scaling import (
     scale_hts_coil_field, 
     thermal_margin_space,
@@ -20,8 +21,11 @@ from hts.high_field_scaling import (
 def generate_corrected_report():
     """Generate corrected performance report with validated parameters."""
     
-    print("🔧 CORRECTED HIGH-FIELD HTS COIL PERFORMANCE REPORT")
-    print("=" * 60)
+    # Collect console output and emit it in one write at the end
+    out = io.StringIO()
+    
+    print("🔧 CORRECTED HIGH-FIELD HTS COIL PERFORMANCE REPORT", file=out)
+    print("=" * 60, file=out)
     
     # Test the corrected configuration
     r = np.array([0, 0, 0])
@@ -32,22 +36,22 @@ def generate_corrected_report():
     R = 0.16  # m
     T = 15    # K
     
-    print(f"\n📋 VALIDATED CONFIGURATION:")
-    print(f"Current per turn: {I} A")
-    print(f"Number of turns: {N}")
-    print(f"Coil radius: {R} m") 
-    print(f"Operating temperature: {T} K")
+    print(f"\n📋 VALIDATED CONFIGURATION:", file=out)
+    print(f"Current per turn: {I} A", file=out)
+    print(f"Number of turns: {N}", file=out)
+    print(f"Coil radius: {R} m", file=out) 
+    print(f"Operating temperature: {T} K", file=out)
     
     # Field analysis
     field_result = scale_hts_coil_field(r, I=I, N=N, R=R, T=T)
     
-    print(f"\n⚡ ELECTROMAGNETIC PERFORMANCE:")
-    print(f"Achieved field: {field_result['B_magnitude']:.2f} T")
-    print(f"Field ripple: {field_result['ripple']:.4f} ({field_result['ripple']*100:.2f}%)")
-    print(f"Critical current density: {field_result['J_c']/1e6:.1f} MA/m²")
-    print(f"Tapes per turn required: {field_result['tapes_per_turn']}")
-    print(f"Current utilization: {field_result['current_utilization']:.2f} (30%)")
-    print(f"Field feasible: {'✅ YES' if field_result['field_feasible'] else '❌ NO'}")
+    print(f"\n⚡ ELECTROMAGNETIC PERFORMANCE:", file=out)
+    print(f"Achieved field: {field_result['B_magnitude']:.2f} T", file=out)
+    print(f"Field ripple: {field_result['ripple']:.4f} ({field_result['ripple']*100:.2f}%)", file=out)
+    print(f"Critical current density: {field_result['J_c']/1e6:.1f} MA/m²", file=out)
+    print(f"Tapes per turn required: {field_result['tapes_per_turn']}", file=out)
+    print(f"Current utilization: {field_result['current_utilization']:.2f} (30%)", file=out)
+    print(f"Field feasible: {'✅ YES' if field_result['field_feasible'] else '❌ NO'}", file=out)
     
     # Thermal analysis
     coil_params = {
@@ -60,35 +64,35 @@ def generate_corrected_report():
     
     thermal_result = thermal_margin_space(coil_params, T_env=4)
     
-    print(f"\n🌡️ THERMAL PERFORMANCE:")
-    print(f"Operating temperature: {T} K")
-    print(f"Final temperature: {thermal_result['T_final']:.2f} K")
-    print(f"Thermal margin: {thermal_result['thermal_margin_K']:.1f} K")
-    print(f"Heat load total: {thermal_result['heat_load_W']:.2f} W")
-    print(f"  - Radiative: {thermal_result['Q_rad_W']:.4f} W")
-    print(f"  - AC losses: {thermal_result['Q_AC_W']:.2f} W")
-    print(f"Cryocooler capacity: 150 W")
-    print(f"Cryocooler margin: {thermal_result['cryocooler_margin_W']:.1f} W")
-    print(f"Space feasible: {'✅ YES' if thermal_result['space_feasible'] else '❌ NO'}")
+    print(f"\n🌡️ THERMAL PERFORMANCE:", file=out)
+    print(f"Operating temperature: {T} K", file=out)
+    print(f"Final temperature: {thermal_result['T_final']:.2f} K", file=out)
+    print(f"Thermal margin: {thermal_result['thermal_margin_K']:.1f} K", file=out)
+    print(f"Heat load total: {thermal_result['heat_load_W']:.2f} W", file=out)
+    print(f"  - Radiative: {thermal_result['Q_rad_W']:.4f} W", file=out)
+    print(f"  - AC losses: {thermal_result['Q_AC_W']:.2f} W", file=out)
+    print(f"Cryocooler capacity: 150 W", file=out)
+    print(f"Cryocooler margin: {thermal_result['cryocooler_margin_W']:.1f} W", file=out)
+    print(f"Space feasible: {'✅ YES' if thermal_result['space_feasible'] else '❌ NO'}", file=out)
     
     # Stress analysis  
     validation = validate_high_field_parameters(I=I, N=N, R=R, T=T, B_target=5.0)
     
-    print(f"\n🔧 MECHANICAL ANALYSIS:")
-    print(f"Hoop stress (unreinforced): {validation['hoop_stress_unreinforced_MPa']:.1f} MPa")
-    print(f"Reinforcement factor required: {validation['reinforcement_factor']:.1f}×")
-    print(f"Hoop stress (reinforced): {validation['hoop_stress_reinforced_MPa']:.1f} MPa")
-    print(f"REBCO stress limit: {validation['rebco_stress_limit_MPa']:.1f} MPa")
-    print(f"Stress feasible: {'✅ YES' if validation['hoop_stress_reinforced_MPa'] <= 35 else '❌ NO'}")
+    print(f"\n🔧 MECHANICAL ANALYSIS:", file=out)
+    print(f"Hoop stress (unreinforced): {validation['hoop_stress_unreinforced_MPa']:.1f} MPa", file=out)
+    print(f"Reinforcement factor required: {validation['reinforcement_factor']:.1f}×", file=out)
+    print(f"Hoop stress (reinforced): {validation['hoop_stress_reinforced_MPa']:.1f} MPa", file=out)
+    print(f"REBCO stress limit: {validation['rebco_stress_limit_MPa']:.1f} MPa", file=out)
+    print(f"Stress feasible: {'✅ YES' if validation['hoop_stress_reinforced_MPa'] <= 35 else '❌ NO'}", file=out)
     
     # Overall assessment
     overall_feasible = validation['parameters_valid']
     
-    print(f"\n🎯 OVERALL ASSESSMENT:")
-    print(f"Target field range: 5-10 T")
-    print(f"Achieved field: {field_result['B_magnitude']:.2f} T")
-    print(f"Target exceeded: {'✅ YES' if field_result['B_magnitude'] >= 5.0 else '❌ NO'}")
-    print(f"All parameters feasible: {'✅ YES' if overall_feasible else '❌ NO'}")
+    print(f"\n🎯 OVERALL ASSESSMENT:", file=out)
+    print(f"Target field range: 5-10 T", file=out)
+    print(f"Achieved field: {field_result['B_magnitude']:.2f} T", file=out)
+    print(f"Target exceeded: {'✅ YES' if field_result['B_magnitude'] >= 5.0 else '❌ NO'}", file=out)
+    print(f"All parameters feasible: {'✅ YES' if overall_feasible else '❌ NO'}", file=out)
     
     # Performance metrics
     performance_metrics = {
@@ -99,32 +103,32 @@ def generate_corrected_report():
             'T_K': T
         },
         'electromagnetic': {
-            'B_field_T': float(field_result['B_magnitude']),
-            'ripple_percent': float(field_result['ripple'] * 100),
-            'current_utilization': float(field_result['current_utilization']),
-            'Jc_MA_per_m2': float(field_result['J_c'] / 1e6),
-            'tapes_per_turn': int(field_result['tapes_per_turn'])
+            'B_field_T': field_result['B_magnitude'],
+            'ripple_percent': field_result['ripple'] * 100,
+            'current_utilization': field_result['current_utilization'],
+            'Jc_MA_per_m2': field_result['J_c'] / 1e6,
+            'tapes_per_turn': field_result['tapes_per_turn']
         },
         'thermal': {
-            'thermal_margin_K': float(thermal_result['thermal_margin_K']),
-            'final_temperature_K': float(thermal_result['T_final']),
-            'heat_load_W': float(thermal_result['heat_load_W']),
-            'cryocooler_margin_W': float(thermal_result['cryocooler_margin_W'])
+            'thermal_margin_K': thermal_result['thermal_margin_K'],
+            'final_temperature_K': thermal_result['T_final'],
+            'heat_load_W': thermal_result['heat_load_W'],
+            'cryocooler_margin_W': thermal_result['cryocooler_margin_W']
         },
         'mechanical': {
-            'hoop_stress_unreinforced_MPa': float(validation['hoop_stress_unreinforced_MPa']),
-            'hoop_stress_reinforced_MPa': float(validation['hoop_stress_reinforced_MPa']),
-            'reinforcement_factor': float(validation['reinforcement_factor'])
+            'hoop_stress_unreinforced_MPa': validation['hoop_stress_unreinforced_MPa'],
+            'hoop_stress_reinforced_MPa': validation['hoop_stress_reinforced_MPa'],
+            'reinforcement_factor': validation['reinforcement_factor']
         },
         'feasibility': {
-            'field_feasible': bool(field_result['field_feasible']),
-            'thermal_feasible': bool(thermal_result['space_feasible']),
-            'stress_feasible': bool(validation['hoop_stress_reinforced_MPa'] <= 35),
-            'overall_feasible': bool(overall_feasible)
+            'field_feasible': field_result['field_feasible'],
+            'thermal_feasible': thermal_result['space_feasible'],
+            'stress_feasible': validation['hoop_stress_reinforced_MPa'] <= 35,
+            'overall_feasible': overall_feasible
         },
         'comparison_to_original': {
             'target_field_T': 5.0,
-            'achieved_vs_target': float(field_result['B_magnitude'] / 5.0),
+            'achieved_vs_target': field_result['B_magnitude'] / 5.0,
             'thermal_margin_improvement': 'Fixed from 0 K to 74.5 K',
             'current_utilization_improvement': 'Fixed from 247.82 to 0.30',
             'stress_feasible_improvement': 'Achieved <35 MPa reinforced'
@@ -133,18 +137,19 @@ def generate_corrected_report():
     }
     
     # Save report
-    with open('corrected_high_field_report.json', 'w') as f:
-        json.dump(performance_metrics, f, indent=2)
+    _json.dump(performance_metrics, 'corrected_high_field_report.json')
         
-    print(f"\n💾 REPORT SAVED: corrected_high_field_report.json")
+    print(f"\n💾 REPORT SAVED: corrected_high_field_report.json", file=out)
     
     # Key improvements summary
-    print(f"\n🚀 KEY IMPROVEMENTS ACHIEVED:")
-    print(f"1. Thermal Margin: 0 K → 74.5 K (>20 K requirement met)")
-    print(f"2. Current Utilization: 247.82 → 0.30 (feasible operation)")  
-    print(f"3. Field Achievement: 7.07 T (exceeds 5-10 T target)")
-    print(f"4. Stress Management: 35 MPa reinforced (within REBCO limits)")
-    print(f"5. Overall Feasibility: ❌ → ✅ (all constraints satisfied)")
+    print(f"\n🚀 KEY IMPROVEMENTS ACHIEVED:", file=out)
+    print(f"1. Thermal Margin: 0 K → 74.5 K (>20 K requirement met)", file=out)
+    print(f"2. Current Utilization: 247.82 → 0.30 (feasible operation)", file=out)  
+    print(f"3. Field Achievement: 7.07 T (exceeds 5-10 T target)", file=out)
+    print(f"4. Stress Management: 35 MPa reinforced (within REBCO limits)", file=out)
+    print(f"5. Overall Feasibility: ❌ → ✅ (all constraints satisfied)", file=out)
+    
+    sys.stdout.write(out.getvalue())
     
     return performance_metrics
 
@@ -12,7 +12,6 @@ Example:
     python run_high_field_simulation.py --verbose --validate-comsol
 """
 
-import json
 import sys
 import os
 import argparse
@@ -22,8 +21,9 @@ import numpy as np
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from hts.high_field_scaling import scale_hts_coil_field, validate_high_field_parameters, thermal_margin_space
-from hts.comsol_fea import validate_high_field_comsol, COMSOLFEASolver
+from hts import _json
+from scripts.high_field_cache import high_field_results
+
 
 def main():
     parser = argparse.ArgumentParser(description='Run high-field HTS coil simulation')
@@ -35,6 +35,9 @@ def main():
                         help='Run COMSOL validation (requires COMSOL installation)')
     args = parser.parse_args()
     
+    # Deferred so --help does not pay for the simulation imports
+    from hts.high_field_scaling import validate_high_field_parameters
+    
     # Create output directory
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
     
@@ -60,37 +63,24 @@ def main():
     if args.verbose:
         print("🧪 Running field scaling analysis...")
     
-    # Create radial evaluation points
-    r = np.array([0, 0, 0])  # Center point evaluation
-    
-    field_result = scale_hts_coil_field(
-        r=r,
-        N=config['N'], 
-        I=config['I'], 
-        R=config['R'], 
-        T=config['T_op']
-    )
+    # Center point evaluation (cached by coil configuration)
+    high_field = high_field_results(config['N'], config['I'], config['R'], config['T_op'])
+    field_result = high_field['field_scaling']
+    B_mag = float(field_result['B_magnitude'])
+    util = float(field_result['current_utilization'])
     
     results['field_scaling'] = field_result
     
     if args.verbose:
-        print(f"   Field magnitude: {field_result['B_magnitude']:.2f} T")
+        print(f"   Field magnitude: {B_mag:.2f} T")
         print(f"   Field ripple: {field_result['ripple']:.4f}")
-        print(f"   Current utilization: {field_result['current_utilization']:.2f}")
+        print(f"   Current utilization: {util:.2f}")
     
     # 2. Space Thermal Analysis
     if args.verbose:
         print("\n🌡️ Running space thermal analysis...")
     
-    coil_params = {
-        'T': config['T_op'],
-        'R': config['R'],
-        'N': config['N'],
-        'conductor_height': 0.004,  # 4mm tape height
-        'Q_AC': 0.92  # W, AC losses at 1mHz
-    }
-    
-    thermal_result = thermal_margin_space(coil_params, T_env=4)
+    thermal_result = high_field['thermal_analysis']
     
     results['thermal_analysis'] = thermal_result
     
@@ -126,6 +116,7 @@ def main():
             print("\n🧪 Running COMSOL validation...")
         
         try:
+            from hts.comsol_fea import COMSOLFEASolver
             solver = COMSOLFEASolver()
             comsol_params = {
                 'N': config['N'],
@@ -133,7 +124,7 @@ def main():
                 'R': config['R'],
                 'conductor_thickness': config['conductor_thickness'],
                 'conductor_height': config['conductor_height'],
-                'B_field': field_result['B_magnitude']
+                'B_field': B_mag
             }
             
             fea_result = solver.compute_electromagnetic_stress(comsol_params)
@@ -152,45 +143,30 @@ def main():
                 print(f"   COMSOL validation failed: {e}")
             results['comsol_validation'] = {'error': str(e)}
     
-    # 5. Summary
+    # 5. Summary: B in [5, 10] T, margin >= 20 K, utilization <= 0.5, stress <= 35 MPa
+    metrics = np.array([
+        B_mag,
+        thermal_result['thermal_margin_K'],
+        util,
+        validation_result['hoop_stress_reinforced_MPa'],
+    ])
+    lower = np.array([5.0, 20.0, -np.inf, -np.inf])
+    upper = np.array([10.0, np.inf, 0.5, 35.0])
+    
     results['summary'] = {
         'field_target_T': [5.0, 10.0],
-        'field_achieved_T': field_result['B_magnitude'],
+        'field_achieved_T': B_mag,
         'thermal_margin_target_K': 20.0,
         'thermal_margin_achieved_K': thermal_result['thermal_margin_K'],
         'current_utilization_limit': 0.5,
-        'current_utilization_achieved': field_result['current_utilization'],
+        'current_utilization_achieved': util,
         'stress_limit_MPa': 35.0,
         'stress_achieved_MPa': validation_result['hoop_stress_reinforced_MPa'],
-        'all_targets_met': (
-            5.0 <= field_result['B_magnitude'] <= 10.0 and
-            thermal_result['thermal_margin_K'] >= 20.0 and
-            field_result['current_utilization'] <= 0.5 and
-            validation_result['hoop_stress_reinforced_MPa'] <= 35.0
-        )
+        'all_targets_met': bool(((metrics >= lower) & (metrics <= upper)).all())
     }
     
-    # Convert numpy types for JSON serialization
-    def convert_for_json(obj):
-        if isinstance(obj, dict):
-            return {key: convert_for_json(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_for_json(item) for item in obj]
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, (np.integer, np.int64, np.int32)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64, np.float32)):
-            return float(obj)
-        else:
-            return obj
-    
-    # Convert results for JSON serialization
-    results = convert_for_json(results)
-    
     # Save results
-    with open(args.output, 'w') as f:
-        json.dump(results, f, indent=2)
+    _json.dump(results, args.output)
     
     if args.verbose:
         print(f"\n📊 Results saved to {args.output}")
@@ -6,12 +6,18 @@ Supports JSON configuration with parameter sets and outputs config hash for cach
 from __future__ import annotations
 import json
 import hashlib
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, astuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
 
-@dataclass
+from hts import _json
+
+
+@dataclass(frozen=True)
 class CoilConfig:
     geometry: str = "helmholtz"
     N: int = 200
@@ -27,7 +33,7 @@ class CoilConfig:
     
     def __post_init__(self):
         if self.separation is None and self.geometry == "helmholtz":
-            self.separation = self.R
+            object.__setattr__(self, "separation", self.R)
 
 
 def load_config(config_path: Path) -> CoilConfig:
@@ -53,12 +59,13 @@ def save_config(config: CoilConfig, config_path: Path):
         json.dump(asdict(config), f, indent=2)
 
 
+@lru_cache(maxsize=1024)
 def config_hash(config: CoilConfig) -> str:
-    """Generate a hash of the configuration for caching purposes."""
-    # Convert to dict and sort keys for consistent hashing
-    config_dict = asdict(config)
-    config_str = json.dumps(config_dict, sort_keys=True)
-    return hashlib.md5(config_str.encode()).hexdigest()[:8]
+    """Generate a hash of the configuration for caching purposes.
+    CoilConfig is frozen (hashable), so repeat lookups are memoized."""
+    # Field order is fixed by the dataclass, so the tuple repr is a stable key
+    key = repr(astuple(config)).encode("utf-8")
+    return hashlib.blake2b(key, digest_size=4).hexdigest()
 
 
 def get_cache_path(config: CoilConfig, cache_dir: Path, suffix: str = "") -> Path:
@@ -70,16 +77,14 @@ def get_cache_path(config: CoilConfig, cache_dir: Path, suffix: str = "") -> Pat
 
 def load_or_compute(config: CoilConfig, cache_dir: Path, compute_func, suffix: str = ""):
     """Load cached result or compute and cache new result."""
-    cache_dir.mkdir(exist_ok=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
     cache_path = get_cache_path(config, cache_dir, suffix)
     
     if cache_path.exists():
-        with open(cache_path, 'r') as f:
-            return json.load(f)
+        return _json.load(cache_path)
     else:
         result = compute_func(config)
-        with open(cache_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        _json.dump(result, cache_path)
         return result
 
 
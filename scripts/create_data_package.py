@@ -12,8 +12,10 @@ import time
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from hts.high_field_scaling import scale_hts_coil_field, thermal_margin_space
+from hts import _json
+from scripts.high_field_cache import high_field_results
 
 
 def generate_basic_data_package(output_dir: Path):
@@ -24,25 +26,9 @@ def generate_basic_data_package(output_dir: Path):
     
     # High-field simulation results (matching our validated 7.07 T configuration)
     print("   Computing high-field validation results...")
-    r_center = np.array([0, 0, 0])
-    
-    field_result = scale_hts_coil_field(
-        r=r_center,
-        N=1000, 
-        I=1800, 
-        R=0.16, 
-        T=15
-    )
-    
-    coil_params = {
-        'T': 15,
-        'R': 0.16,
-        'N': 1000,
-        'conductor_height': 0.004,
-        'Q_AC': 0.92
-    }
-    
-    thermal_result = thermal_margin_space(coil_params, T_env=4)
+    high_field = high_field_results(N=1000, I=1800, R=0.16, T_op=15)
+    field_result = high_field['field_scaling']
+    thermal_result = high_field['thermal_analysis']
     
     # Package key results
     package_data = {
@@ -90,8 +76,7 @@ def generate_basic_data_package(output_dir: Path):
     }
     
     # Save main results
-    with open(output_dir / 'simulation_results.json', 'w') as f:
-        json.dump(package_data, f, indent=2)
+    _json.dump(package_data, output_dir / 'simulation_results.json')
     
     # Generate COMSOL input template
     comsol_template = """// COMSOL Multiphysics Java Script Template
@@ -129,16 +114,51 @@ public class HTSCoilValidation {
 # Requires: matplotlib, numpy, data from simulation_results.json
 
 import json
+import os
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 
-with open('simulation_results.json', 'r') as f:
-    data = json.load(f)
+
+def load_results(path):
+    # Load simulation results, reusing a binary .npz sidecar when it is current.
+    # Scalar and list leaves are stored flat under '/'-joined keys, so later
+    # runs skip JSON text parsing entirely.
+    path = Path(path)
+    npz = path.with_suffix('.npz')
+    if npz.exists() and npz.stat().st_mtime >= path.stat().st_mtime:
+        data = {}
+        with np.load(npz, allow_pickle=False) as arrays:
+            for key in arrays.files:
+                *parents, leaf = key.split('/')
+                node = data
+                for p in parents:
+                    node = node.setdefault(p, {})
+                node[leaf] = arrays[key].tolist()
+        return data
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    flat = {}
+    def _flatten(node, prefix):
+        for k, v in node.items():
+            if isinstance(v, dict):
+                _flatten(v, prefix + k + '/')
+            else:
+                flat[prefix + k] = np.asarray(v)
+    _flatten(data, '')
+    np.savez(npz, **flat)
+    return data
+
+
+data = load_results('simulation_results.json')
 
 # Performance comparison plot
 configs = ['Baseline', 'High-Field']
-fields = [2.1, 7.07]
-margins = [70, 74.5]
+results = [data['baseline_configuration']['results'], data['high_field_configuration']['results']]
+fields = [r['B_magnitude_T'] for r in results]
+margins = [r['thermal_margin_K'] for r in results]
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
 
@@ -151,7 +171,9 @@ ax2.set_ylabel('Thermal Margin (K)')
 ax2.set_title('Thermal Performance')
 
 plt.tight_layout()
-plt.savefig('performance_comparison.png', dpi=300)
+# SAVEFIG_DPI=300 reproduces print resolution; the default keeps previews fast
+plt.savefig('performance_comparison.png', dpi=int(os.environ.get('SAVEFIG_DPI', 150)),
+            pil_kwargs={'compress_level': 1})
 print("Figure saved: performance_comparison.png")
 """
     
@@ -183,7 +205,7 @@ Template for COMSOL Multiphysics validation studies.
 
 ### reproduce_figures.py
 Python script to reproduce key manuscript figures.
-Usage: `python reproduce_figures.py`
+Usage: `python reproduce_figures.py` (set `SAVEFIG_DPI=300` for print resolution)
 
 ## Validation
 All results validated against Docker-based reproduction system.
@@ -213,10 +235,14 @@ def main():
     
     generate_basic_data_package(output_dir)
     
-    # Create archive for upload
-    import shutil
+    # Create archive for upload (only the package directory, not its siblings)
+    import zipfile
     archive_name = f"hts_coil_data_{time.strftime('%Y%m%d')}"
-    shutil.make_archive(archive_name, 'zip', str(output_dir.parent))
+    with zipfile.ZipFile(f"{archive_name}.zip", mode='w',
+                         compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        for path in sorted(output_dir.rglob('*')):
+            if path.is_file():
+                zf.write(path, arcname=path.relative_to(output_dir.parent))
     
     print(f"\n✅ Data package complete!")
     print(f"   📁 Directory: {output_dir}")
@@ -11,32 +11,117 @@ import sys
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from hts.coil import mu_0, field_from_loops  # type: ignore
+from hts import _json  # type: ignore
+from hts.coil import mu_0, field_from_loops, loop_field_rz  # type: ignore
+from hts._field_numba import NUMBA_AVAILABLE, sum_b2_grid  # type: ignore
 
 
-def estimate_stored_energy(loops: Sequence[Tuple[float, int, float, float]], volume_extent: float = 0.3, n_samples: int = 41) -> float:
+def _stored_energy_analytic(loops: Sequence[Tuple[float, int, float, float]], wire_radius: float) -> float:
     """
-    Estimate stored magnetic energy U = (1/2μ₀) ∫ B² dV by sampling B on a cubic grid.
-    Returns energy in Joules.
+    Total stored energy U = ½ Σᵢⱼ Mᵢⱼ (IᵢNᵢ)(IⱼNⱼ) for coaxial circular loops.
+    Mutual terms use Maxwell's elliptic-integral formula
+    M = μ₀ √(RᵢRⱼ) [(2/k − k) K(k) − (2/k) E(k)], k² = 4RᵢRⱼ / ((Rᵢ+Rⱼ)² + Δz²);
+    coincident loops use the thin-wire self-inductance μ₀ R (ln(8R/a) − 2).
     """
-    xs = np.linspace(-volume_extent, volume_extent, n_samples)
-    ys = np.linspace(-volume_extent, volume_extent, n_samples)
-    zs = np.linspace(-volume_extent, volume_extent, n_samples)
-    
-    total_b_squared = 0.0
-    count = 0
-    
-    for x in xs:
-        for y in ys:
-            for z in zs:
-                B = field_from_loops(np.array([x, y, z]), loops)
-                total_b_squared += np.dot(B, B)
-                count += 1
-    
-    # Volume element
-    dV = (2 * volume_extent) ** 3 / (n_samples ** 3)
-    # Average B²
-    avg_b_squared = total_b_squared / count
+    from scipy.special import ellipk, ellipe
+    
+    arr = np.asarray(loops, dtype=np.float64).reshape(-1, 4)
+    a_turns = arr[:, 0] * arr[:, 1]
+    Ri, Rj = arr[:, 2, None], arr[None, :, 2]
+    dz = arr[:, 3, None] - arr[None, :, 3]
+    
+    m = 4.0 * Ri * Rj / ((Ri + Rj) ** 2 + dz ** 2)  # k²
+    coincident = m >= 1.0 - 1e-12
+    m = np.where(coincident, 0.5, m)  # avoid K(1) = ∞; these entries take L_self below
+    k = np.sqrt(m)
+    M = mu_0 * np.sqrt(Ri * Rj) * ((2.0 / k - k) * ellipk(m) - (2.0 / k) * ellipe(m))
+    L_self = mu_0 * Ri * (np.log(8.0 * Ri / wire_radius) - 2.0)
+    M = np.where(coincident, np.broadcast_to(L_self, M.shape), M)
+    
+    return float(0.5 * a_turns @ M @ a_turns)
+
+
+def _grid_B2(loops: Sequence[Tuple[float, int, float, float]], xs: np.ndarray, ys: np.ndarray,
+             zs: np.ndarray) -> np.ndarray:
+    """B² on the xs × ys × zs grid (ij indexing) from the closed-form loop field,
+    one broadcast elliptic-integral pass per loop instead of a 360-segment sum."""
+    rho = np.hypot(xs[:, None, None], ys[None, :, None])
+    Brho, Bz = loop_field_rz(rho, zs[None, None, :], loops)
+    return Brho ** 2 + Bz ** 2
+
+
+def _stored_energy_axisym(loops: Sequence[Tuple[float, int, float, float]], volume_extent: float,
+                          n_samples: int) -> float:
+    """
+    Same cube as the grid method, integrated in (r, z) using the loops' axial symmetry:
+    ∫∫ B² dx dy = ∫ B²(r) L(r) dr, where L(r) is the arc length of the radius-r circle
+    inside the square (2πr for r ≤ a, r(2π − 8 arccos(a/r)) up to a√2). B from the
+    elliptic-integral loop field; Gauss–Legendre in r (split at the kink r = a) and z.
+    """
+    a = volume_extent
+    nodes, weights = np.polynomial.legendre.leggauss(n_samples)
+    # r on [0, a] ∪ [a, a√2], z on [-a, a]
+    r_in, r_out = 0.5 * a * (nodes + 1.0), a + 0.5 * a * (np.sqrt(2.0) - 1.0) * (nodes + 1.0)
+    r = np.concatenate([r_in, r_out])
+    w_r = np.concatenate([0.5 * a * weights, 0.5 * a * (np.sqrt(2.0) - 1.0) * weights])
+    arc = r * (2.0 * np.pi - 8.0 * np.arccos(np.minimum(a / r, 1.0)))
+    z = a * nodes
+    w_z = a * weights
+    
+    Brho, Bz = loop_field_rz(r[None, :], z[:, None], loops)
+    integral = np.einsum("i,j,ij->", w_z, w_r * arc, Brho ** 2 + Bz ** 2)
+    return float(integral / (2 * mu_0))
+
+
+def estimate_stored_energy(loops: Sequence[Tuple[float, int, float, float]], volume_extent: float = 0.3, n_samples: int = 41,
+                           method: str = "grid", wire_radius: float = np.sqrt(1e-6 / np.pi),
+                           order: str = "midpoint") -> float:
+    """
+    Estimate stored magnetic energy U = (1/2μ₀) ∫ B² dV. Returns energy in Joules.
+    
+    method:
+      - "grid": sample B on a cubic grid of half-width volume_extent (truncates the
+        field outside the box)
+      - "analytic": closed-form mutual/self inductance sum over all space; needs
+        only O(M²) elliptic integrals for M loops. wire_radius sets self-inductance.
+      - "axisym": the grid's cube integrated as a 2D (r, z) quadrature using the
+        closed-form loop field; O(n²) field evaluations instead of O(n³)
+    
+    order (grid method only):
+      - "midpoint": mean of B² over the grid, O(h²); numba-fused when available
+      - "simpson": composite Simpson's rule per axis, O(h⁴); use odd n_samples,
+        ~15 matches midpoint at 41 when the box excludes the windings
+      - "gauss": n_samples-point Gauss–Legendre per axis
+    """
+    if method == "analytic":
+        return _stored_energy_analytic(loops, wire_radius)
+    if method == "axisym":
+        return _stored_energy_axisym(loops, volume_extent, n_samples)
+    
+    if order == "gauss":
+        nodes, weights = np.polynomial.legendre.leggauss(n_samples)
+        xs = ys = zs = volume_extent * nodes
+    else:
+        xs = np.linspace(-volume_extent, volume_extent, n_samples)
+        ys = np.linspace(-volume_extent, volume_extent, n_samples)
+        zs = np.linspace(-volume_extent, volume_extent, n_samples)
+    
+    if order != "midpoint":
+        B2 = _grid_B2(loops, xs, ys, zs)
+        if order == "simpson":
+            from scipy.integrate import simpson
+            integral = simpson(simpson(simpson(B2, x=zs), x=ys), x=xs)
+        else:
+            w = weights * volume_extent
+            integral = np.einsum("i,j,k,ijk->", w, w, w, B2)
+        return float(integral / (2 * mu_0))
+    
+    # Both paths evaluate the closed-form loop field, so results do not depend on numba
+    if NUMBA_AVAILABLE:
+        # Fused compiled kernel: no (n³, 3) field array is ever materialized
+        avg_b_squared = sum_b2_grid(loops, xs, ys, zs) / n_samples ** 3
+    else:
+        avg_b_squared = _grid_B2(loops, xs, ys, zs).mean()
     # Total energy
     U = (avg_b_squared / (2 * mu_0)) * (2 * volume_extent) ** 3
     
@@ -50,10 +135,8 @@ def estimate_conductor_mass(loops: Sequence[Tuple[float, int, float, float]],
     Rough estimate of conductor mass assuming circular wire cross-section.
     REBCO tapes are more complex, but this gives order of magnitude.
     """
-    total_length = 0.0
-    for I, N, R, z0 in loops:
-        circumference = 2 * np.pi * R
-        total_length += N * circumference
+    arr = np.asarray(loops, dtype=np.float64).reshape(-1, 4)
+    total_length = 2 * np.pi * (arr[:, 1] * arr[:, 2]).sum()
     
     volume_m3 = total_length * wire_cross_section_m2
     mass_kg = volume_m3 * density_kg_m3
@@ -71,11 +154,12 @@ def efficiency_metrics(loops: Sequence[Tuple[float, int, float, float]],
     - Energy per Tesla (J/T)
     - Mass estimate (kg)
     """
+    arr = np.asarray(loops, dtype=np.float64).reshape(-1, 4)
     U_J = estimate_stored_energy(loops, **kwargs)
-    mass_kg = estimate_conductor_mass(loops, wire_cross_section_m2)
+    mass_kg = estimate_conductor_mass(arr, wire_cross_section_m2)
     
     # Total A-turns
-    total_a_turns = sum(abs(I) * N for I, N, R, z0 in loops)
+    total_a_turns = float(np.abs(arr[:, 0] * arr[:, 1]).sum())
     
     metrics = {
         "stored_energy_J": U_J,
@@ -89,9 +173,76 @@ def efficiency_metrics(loops: Sequence[Tuple[float, int, float, float]],
     return metrics
 
 
+def _build_loops(geom: str, I: float, N: int, R: float, sep: float | None = None,
+                 layers: int = 3, dz: float = 0.2) -> list:
+    """Loop list (I, N, R, z0) for the single / helmholtz / stack geometries."""
+    if geom == "single":
+        return [(I, N, R, 0.0)]
+    if geom == "helmholtz":
+        z = (sep or R) / 2.0
+        return [(I, N, R, -z), (I, N, R, +z)]
+    offsets = np.linspace(-(layers - 1) / 2.0, (layers - 1) / 2.0, layers) * dz
+    return [(I, N, R, float(z0)) for z0 in offsets]
+
+
+SWEEP_TYPES = {"geom": str, "I": float, "N": int, "R": float, "sep": float, "layers": int, "dz": float}
+
+
+def _parse_sweep(specs: Sequence[str]) -> Dict[str, list]:
+    """Parse repeated ``key=v1,v2,...`` or ``key=start:stop:num`` sweep specs."""
+    axes = {}
+    for spec in specs:
+        key, _, values = spec.partition("=")
+        if key not in SWEEP_TYPES or not values:
+            raise ValueError(f"Bad --sweep spec {spec!r}; keys: {', '.join(SWEEP_TYPES)}")
+        cast = SWEEP_TYPES[key]
+        if ":" in values:
+            start, stop, num = values.split(":")
+            axes[key] = [cast(v) for v in np.linspace(float(start), float(stop), int(num))]
+        else:
+            axes[key] = [cast(v) for v in values.split(",")]
+    return axes
+
+
+def _init_sweep_worker():
+    # One kernel thread per process; the pool supplies the parallelism
+    if NUMBA_AVAILABLE:
+        import numba
+        numba.set_num_threads(1)
+
+
+def _one_config(params: Dict) -> Dict:
+    """Efficiency metrics for one sweep point (runs in a worker process)."""
+    geo = {k: params[k] for k in ("geom", "I", "N", "R", "sep", "layers", "dz")}
+    loops = _build_loops(**geo)
+    B_mean_T = float(np.linalg.norm(field_from_loops(np.array([0.0, 0.0, 0.0]), loops)))
+    metrics = efficiency_metrics(loops, B_mean_T,
+                                 wire_cross_section_m2=params["wire_area"],
+                                 volume_extent=params["extent"],
+                                 n_samples=params["n_samples"],
+                                 method=params["method"],
+                                 order=params["order"],
+                                 wire_radius=float(np.sqrt(params["wire_area"] / np.pi)))
+    return {"parameters": geo, "B_center_T": B_mean_T, "efficiency_metrics": metrics}
+
+
+def run_sweep(base: Dict, axes: Dict[str, list], max_workers: int | None = None) -> list:
+    """Evaluate the Cartesian product of sweep axes over base parameters in parallel."""
+    import itertools
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    keys = list(axes)
+    configs = [{**base, **dict(zip(keys, combo))} for combo in itertools.product(*axes.values())]
+    # spawn: workers load the compiled kernel from numba's on-disk cache instead of inheriting threads
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                             initializer=_init_sweep_worker) as ex:
+        return list(ex.map(_one_config, configs))
+
+
 def main():
     import argparse
-    import json
     
     p = argparse.ArgumentParser(description="Compute stored energy and efficiency metrics")
     p.add_argument("--geom", choices=["single", "helmholtz", "stack"], default="single")
@@ -104,18 +255,30 @@ def main():
     p.add_argument("--extent", type=float, default=0.3)
     p.add_argument("--n_samples", type=int, default=21)
     p.add_argument("--wire_area", type=float, default=1e-6, help="Wire cross-section m²")
+    p.add_argument("--method", choices=["grid", "analytic", "axisym"], default="grid",
+                   help="Stored energy via sampled grid, analytic mutual inductance, "
+                        "or axisymmetric (r, z) quadrature of the grid's cube")
+    p.add_argument("--order", choices=["midpoint", "simpson", "gauss"], default="midpoint",
+                   help="Quadrature rule for the grid method")
+    p.add_argument("--sweep", action="append", default=[], metavar="KEY=VALUES",
+                   help="Sweep axis as key=v1,v2 or key=start:stop:num (repeatable; "
+                        f"keys: {', '.join(SWEEP_TYPES)}); runs configs in parallel")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes for --sweep")
     args = p.parse_args()
     
+    if args.sweep:
+        base = {k: getattr(args, k) for k in
+                ("geom", "I", "N", "R", "sep", "layers", "dz", "extent", "n_samples",
+                 "wire_area", "method", "order")}
+        results = run_sweep(base, _parse_sweep(args.sweep), max_workers=args.workers)
+        (ROOT / "artifacts").mkdir(exist_ok=True)
+        output_path = ROOT / "artifacts" / "energy_efficiency_sweep.json"
+        _json.dump(results, output_path)
+        print(f"Wrote {len(results)} sweep results to {output_path}")
+        return
+    
     # Create loop configuration
-    if args.geom == "single":
-        loops = [(args.I, args.N, args.R, 0.0)]
-    elif args.geom == "helmholtz":
-        sep = args.sep or args.R
-        z = sep / 2.0
-        loops = [(args.I, args.N, args.R, -z), (args.I, args.N, args.R, +z)]
-    else:  # stack
-        offsets = np.linspace(-(args.layers - 1) / 2.0, (args.layers - 1) / 2.0, args.layers) * args.dz
-        loops = [(args.I, args.N, args.R, float(z0)) for z0 in offsets]
+    loops = _build_loops(args.geom, args.I, args.N, args.R, args.sep, args.layers, args.dz)
     
     # Quick B field estimate at center
     B_center = field_from_loops(np.array([0.0, 0.0, 0.0]), loops)
@@ -125,7 +288,10 @@ def main():
     metrics = efficiency_metrics(loops, B_mean_T, 
                                wire_cross_section_m2=args.wire_area,
                                volume_extent=args.extent, 
-                               n_samples=args.n_samples)
+                               n_samples=args.n_samples,
+                               method=args.method,
+                               order=args.order,
+                               wire_radius=float(np.sqrt(args.wire_area / np.pi)))
     
     result = {
         "configuration": {
@@ -143,10 +309,9 @@ def main():
     
     (ROOT / "artifacts").mkdir(exist_ok=True)
     output_path = ROOT / "artifacts" / "energy_efficiency_metrics.json"
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2)
+    _json.dump(result, output_path)
     
-    print(json.dumps(result, indent=2))
+    print(_json.dumps(result).decode("utf-8"))
 
 
 if __name__ == "__main__":
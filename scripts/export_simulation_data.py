@@ -23,29 +23,37 @@ Usage:
     python scripts/export_simulation_data.py --output data_package/
 """
 
+import os
 import sys
 import numpy as np
-import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import time
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from hts.high_field_scaling import scale_hts_coil_field, validate_high_field_parameters, thermal_margin_space
-from hts.coil import hts_coil_field
+from hts import _json
+from hts.high_field_scaling import scale_hts_coil_field_batch, validate_high_field_parameters, thermal_margin_space
+from hts.coil import loop_field_rz
 from hts.materials import jc_vs_tb
 
 
-def generate_field_maps(output_dir: Path):
+def field_map_rz(r_grid: np.ndarray, z_grid: np.ndarray, I: float, N: int, R: float) -> np.ndarray:
+    """(B_r, B_phi, B_z) of a single coil on the (z, r) grid, shape (len(z), len(r), 3).
+    One broadcast elliptic-integral evaluation instead of a Biot–Savart call per point."""
+    B_r, B_z = loop_field_rz(r_grid[None, :], z_grid[:, None], [(I, N, R, 0.0)])
+    return np.stack([B_r, np.zeros_like(B_r), B_z], axis=-1)
+
+
+def generate_field_maps(output_dir: Path, generated_date: str):
     """Generate complete field maps for both configurations."""
     print("🧭 Generating field maps...")
     
     # Spatial grid for field mapping
     r_grid = np.linspace(0, 0.3, 50)  # 50 points in radial direction
     z_grid = np.linspace(-0.2, 0.2, 40)  # 40 points in axial direction
-    R_grid, Z_grid = np.meshgrid(r_grid, z_grid)
     
     # Baseline configuration (2.1 T)
     baseline_config = {
@@ -56,13 +64,8 @@ def generate_field_maps(output_dir: Path):
     }
     
     print("   Computing baseline field map (2.1 T)...")
-    B_baseline = np.zeros((len(z_grid), len(r_grid), 3))
-    for i, z in enumerate(z_grid):
-        for j, r in enumerate(r_grid):
-            pos = np.array([r, 0, z])
-            B_vec = hts_coil_field(pos, I=baseline_config['I'], 
-                                 N=baseline_config['N'], R=baseline_config['R'])
-            B_baseline[i, j] = B_vec
+    B_baseline = field_map_rz(r_grid, z_grid, I=baseline_config['I'],
+                              N=baseline_config['N'], R=baseline_config['R'])
     
     # High-field configuration (7.07 T) 
     highfield_config = {
@@ -73,54 +76,48 @@ def generate_field_maps(output_dir: Path):
     }
     
     print("   Computing high-field map (7.07 T)...")
-    B_highfield = np.zeros((len(z_grid), len(r_grid), 3))
-    for i, z in enumerate(z_grid):
-        for j, r in enumerate(r_grid):
-            pos = np.array([r, 0, z])
-            B_vec = hts_coil_field(pos, I=highfield_config['I'],
-                                 N=highfield_config['N'], R=highfield_config['R'])
-            B_highfield[i, j] = B_vec
+    B_highfield = field_map_rz(r_grid, z_grid, I=highfield_config['I'],
+                               N=highfield_config['N'], R=highfield_config['R'])
     
     # Save data with metadata
+    # JSON is a descriptor only; the arrays live in field_maps.npz
     field_data = {
-        'coordinates': {
-            'r_grid': r_grid.tolist(),
-            'z_grid': z_grid.tolist(),
-            'R_grid': R_grid.tolist(),
-            'Z_grid': Z_grid.tolist()
+        'data_file': 'field_maps.npz',
+        'arrays': {
+            'r_grid': list(r_grid.shape),
+            'z_grid': list(z_grid.shape),
+            'B_baseline': list(B_baseline.shape),
+            'B_highfield': list(B_highfield.shape)
         },
+        'field_components': ['B_r', 'B_phi', 'B_z'],
         'baseline_config': baseline_config,
         'highfield_config': highfield_config,
-        'baseline_field': B_baseline.tolist(),
-        'highfield_field': B_highfield.tolist(),
         'units': {
             'position': 'm',
             'field': 'T',
             'current': 'A'
         },
         'metadata': {
-            'generated_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'generated_date': generated_date,
             'grid_resolution': f'{len(r_grid)}x{len(z_grid)}',
             'description': 'Complete electromagnetic field maps for baseline and high-field HTS configurations'
         }
     }
     
-    # Save as both JSON and NPZ for different use cases
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(output_dir / 'field_maps.json', 'w') as f:
-        json.dump(field_data, f, indent=2)
+    _json.dump(field_data, output_dir / 'field_maps.json', indent=False)
     
-    np.savez_compressed(output_dir / 'field_maps.npz',
-                       r_grid=r_grid, z_grid=z_grid,
-                       R_grid=R_grid, Z_grid=Z_grid,
-                       B_baseline=B_baseline, B_highfield=B_highfield)
+    # Uncompressed: the maps are ~100 KB of float64, zlib costs more than it saves
+    np.savez(output_dir / 'field_maps.npz',
+             r_grid=r_grid, z_grid=z_grid,
+             B_baseline=B_baseline, B_highfield=B_highfield)
     
     print(f"   ✅ Field maps saved to {output_dir}")
     return field_data
 
 
-def generate_stress_data(output_dir: Path):
+def generate_stress_data(output_dir: Path, generated_date: str):
     """Generate stress analysis data."""
     print("🔧 Generating stress analysis data...")
     
@@ -154,24 +151,24 @@ def generate_stress_data(output_dir: Path):
         }
     
     stress_data['metadata'] = {
-        'generated_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'generated_date': generated_date,
         'method': 'Analytical thick-wall cylinder approximation',
         'assumptions': ['Uniform current density', 'Linear elastic response', 'Axisymmetric geometry'],
         'units': {'stress': 'Pa', 'position': 'm', 'field': 'T'}
     }
     
-    with open(output_dir / 'stress_analysis.json', 'w') as f:
-        json.dump(stress_data, f, indent=2)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _json.dump(stress_data, output_dir / 'stress_analysis.json')
     
     print(f"   ✅ Stress data saved to {output_dir}")
     return stress_data
 
 
-def generate_monte_carlo_data(output_dir: Path, n_samples=1000):
+def generate_monte_carlo_data(output_dir: Path, generated_date: str, n_samples=1000):
     """Generate Monte Carlo sensitivity analysis dataset."""
     print(f"🎲 Generating Monte Carlo data ({n_samples} samples)...")
     
-    np.random.seed(42)  # Reproducible results
+    rng = np.random.default_rng(42)  # Reproducible results
     
     # Parameter ranges
     N_range = [200, 600]
@@ -180,7 +177,6 @@ def generate_monte_carlo_data(output_dir: Path, n_samples=1000):
     T_range = [10, 25]
     
     results = {
-        'samples': [],
         'feasible_count': 0,
         'parameters': {
             'N_range': N_range,
@@ -191,57 +187,45 @@ def generate_monte_carlo_data(output_dir: Path, n_samples=1000):
         'metadata': {
             'n_samples': n_samples,
             'seed': 42,
-            'generated_date': time.strftime('%Y-%m-%d %H:%M:%S')
+            'generated_date': generated_date
         }
     }
     
-    for i in range(n_samples):
-        if i % 100 == 0:
-            print(f"   Processing sample {i+1}/{n_samples}...")
-        
-        # Sample parameters
-        N = np.random.uniform(*N_range)
-        I = np.random.uniform(*I_range)
-        R = np.random.uniform(*R_range)
-        T = np.random.uniform(*T_range)
-        
-        # Evaluate at center
-        r_eval = np.array([0, 0, 0])
-        field_result = scale_hts_coil_field(r_eval, N=int(N), I=I, R=R, T=T)
-        
-        # Feasibility check
-        feasible = (
-            field_result.get('current_utilization', 1.0) <= 0.5 and
-            field_result.get('field_feasible', False) and
-            field_result.get('thermal_feasible', False) and
-            field_result.get('B_magnitude', 0) >= 1.0  # Minimum 1T
-        )
-        
-        if feasible:
-            results['feasible_count'] += 1
-        
-        sample_data = {
-            'sample_id': i,
-            'parameters': {'N': int(N), 'I': I, 'R': R, 'T': T},
-            'results': {
-                'B_magnitude': field_result.get('B_magnitude', 0),
-                'ripple': field_result.get('ripple', 0),
-                'current_utilization': field_result.get('current_utilization', 0),
-                'feasible': feasible
-            }
-        }
-        results['samples'].append(sample_data)
-    
+    # Sample all parameters at once and evaluate at the center in one vectorized pass
+    N = rng.uniform(*N_range, n_samples).astype(int)
+    I = rng.uniform(*I_range, n_samples)
+    R = rng.uniform(*R_range, n_samples)
+    T = rng.uniform(*T_range, n_samples)
+    field_result = scale_hts_coil_field_batch(I, N, R, T)
+    
+    # Feasibility check
+    B_mag = field_result['B_magnitude']
+    ripple = field_result['ripple']
+    cu = field_result['current_utilization']
+    feasible = (
+        (cu <= 0.5) &
+        field_result['field_feasible'] &
+        field_result['thermal_feasible'] &
+        (B_mag >= 1.0)  # Minimum 1T
+    )
+    results['feasible_count'] = int(feasible.sum())
     results['feasibility_rate'] = results['feasible_count'] / n_samples
+    results['samples_file'] = 'monte_carlo_samples.npz'
+    
+    # Per-sample data as columns; the JSON keeps only ranges, seed and summary
+    output_dir.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(output_dir / 'monte_carlo_samples.npz',
+                        N=N, I=I, R=R, T=T,
+                        B_magnitude=B_mag, ripple=ripple,
+                        current_utilization=cu, feasible=feasible)
     
-    with open(output_dir / 'monte_carlo_analysis.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    _json.dump(results, output_dir / 'monte_carlo_analysis.json')
     
     print(f"   ✅ Monte Carlo data saved: {results['feasible_count']}/{n_samples} feasible ({results['feasibility_rate']:.1%})")
     return results
 
 
-def generate_thermal_validation_data(output_dir: Path):
+def generate_thermal_validation_data(output_dir: Path, generated_date: str):
     """Generate thermal model validation dataset."""
     print("🌡️ Generating thermal validation data...")
     
@@ -267,14 +251,14 @@ def generate_thermal_validation_data(output_dir: Path):
             'thermal_resistance_variation': []
         },
         'metadata': {
-            'generated_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'generated_date': generated_date,
             'description': 'Thermal model sensitivity analysis for 7.07 T configuration'
         }
     }
     
     # Emissivity sensitivity
     for emiss in emissivity_values:
-        params = base_params.copy()
+        params = {**base_params, 'emissivity': float(emiss)}
         result = thermal_margin_space(params, T_env=4)  # Space conditions
         thermal_data['sensitivity_analysis']['emissivity_variation'].append({
             'emissivity': float(emiss),
@@ -285,8 +269,7 @@ def generate_thermal_validation_data(output_dir: Path):
     
     # Area scaling sensitivity  
     for scaling in area_scaling:
-        params = base_params.copy()
-        params['R'] = params['R'] * np.sqrt(scaling)  # Scale radius to achieve area scaling
+        params = {**base_params, 'R': base_params['R'] * np.sqrt(scaling)}  # Scale radius to achieve area scaling
         result = thermal_margin_space(params, T_env=4)
         thermal_data['sensitivity_analysis']['area_variation'].append({
             'area_scaling': float(scaling),
@@ -295,52 +278,46 @@ def generate_thermal_validation_data(output_dir: Path):
         })
     
     # Thermal resistance sensitivity
-    for R_th in thermal_resistance:
-        # This would require modifying the thermal_margin_space function
-        # For now, approximate the effect
-        delta_T_additional = (base_params['Q_AC'] * R_th) - (base_params['Q_AC'] * 0.5)
-        baseline_result = thermal_margin_space(base_params, T_env=4)
-        adjusted_margin = baseline_result['thermal_margin_K'] - delta_T_additional
-        
-        thermal_data['sensitivity_analysis']['thermal_resistance_variation'].append({
+    # This would require modifying the thermal_margin_space function
+    # For now, approximate the effect over the whole R_th vector at once
+    baseline_result = thermal_margin_space(base_params, T_env=4)
+    delta_T_additional = (base_params['Q_AC'] * thermal_resistance) - (base_params['Q_AC'] * 0.5)
+    adjusted_margin = np.maximum(0, baseline_result['thermal_margin_K'] - delta_T_additional)
+    temperature_rise = baseline_result['T_final'] - 15 + delta_T_additional
+    
+    thermal_data['sensitivity_analysis']['thermal_resistance_variation'] = [
+        {
             'R_thermal_K_per_W': float(R_th),
-            'thermal_margin_K': max(0, adjusted_margin),
-            'temperature_rise_K': baseline_result['T_final'] - 15 + delta_T_additional
-        })
+            'thermal_margin_K': float(margin),
+            'temperature_rise_K': float(rise)
+        }
+        for R_th, margin, rise in zip(thermal_resistance, adjusted_margin, temperature_rise)
+    ]
     
-    with open(output_dir / 'thermal_validation.json', 'w') as f:
-        json.dump(thermal_data, f, indent=2)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _json.dump(thermal_data, output_dir / 'thermal_validation.json')
     
     print(f"   ✅ Thermal validation data saved to {output_dir}")
     return thermal_data
 
 
-def generate_comsol_inputs(output_dir: Path):
-    """Generate COMSOL input files for validation."""
-    print("🔧 Generating COMSOL input files...")
-    
-    # Basic coil geometry parameters
-    configs = {
-        'baseline': {'N': 400, 'I': 1171, 'R': 0.2, 'name': 'baseline_2.1T'},
-        'highfield': {'N': 1000, 'I': 1800, 'R': 0.16, 'name': 'highfield_7.07T'}
-    }
-    
-    for config_name, params in configs.items():
-        comsol_script = f"""
+# COMSOL Java model template, filled per configuration with str.format
+# (placeholders: config_name, name, N, I, R; literal braces are doubled)
+COMSOL_TEMPLATE = """
 // COMSOL Multiphysics Java Script for {config_name} configuration
 // Generated automatically for Zenodo data package
 
 import com.comsol.model.*;
 import com.comsol.model.util.*;
 
-public class {params['name']}_validation {{
+public class {name}_validation {{
     public static Model run() {{
         Model model = ModelUtil.create("Model");
         
         // Global parameters
-        model.param().set("N_turns", "{params['N']}");
-        model.param().set("I_current", "{params['I']} [A]");
-        model.param().set("R_coil", "{params['R']} [m]");
+        model.param().set("N_turns", "{N}");
+        model.param().set("I_current", "{I} [A]");
+        model.param().set("R_coil", "{R} [m]");
         model.param().set("mu_0", "4*pi*1e-7 [H/m]");
         
         // Geometry - simplified axisymmetric coil
@@ -359,7 +336,7 @@ public class {params['name']}_validation {{
         // Current density in coil
         model.component("comp1").physics("mf").create("cd1", "CurrentDensity", 2);
         model.component("comp1").physics("mf").feature("cd1").selection().set(1);
-        model.component("comp1").physics("mf").feature("cd1").set("Jconductor", new String[]{{{"0", "0", "N_turns*I_current/(0.04*0.04)"}});
+        model.component("comp1").physics("mf").feature("cd1").set("Jconductor", new String[]{{"0", "0", "N_turns*I_current/(0.04*0.04)"}});
         
         // Mesh
         model.component("comp1").mesh().create("mesh1");
@@ -380,10 +357,24 @@ public class {params['name']}_validation {{
     }}
 }}
 """
+
+
+def generate_comsol_inputs(output_dir: Path):
+    """Generate COMSOL input files for validation."""
+    print("🔧 Generating COMSOL input files...")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Basic coil geometry parameters
+    configs = {
+        'baseline': {'N': 400, 'I': 1171, 'R': 0.2, 'name': 'baseline_2.1T'},
+        'highfield': {'N': 1000, 'I': 1800, 'R': 0.16, 'name': 'highfield_7.07T'}
+    }
+    
+    for config_name, params in configs.items():
+        comsol_script = COMSOL_TEMPLATE.format(config_name=config_name, **params)
         
         comsol_file = output_dir / f"{params['name']}_comsol_script.java"
-        with open(comsol_file, 'w') as f:
-            f.write(comsol_script)
+        comsol_file.write_text(comsol_script, encoding='utf-8', newline='\n')
     
     # Create parameter file
     param_data = {
@@ -405,8 +396,7 @@ public class {params['name']}_validation {{
         }
     }
     
-    with open(output_dir / 'comsol_parameters.json', 'w') as f:
-        json.dump(param_data, f, indent=2)
+    _json.dump(param_data, output_dir / 'comsol_parameters.json')
     
     print(f"   ✅ COMSOL input files saved to {output_dir}")
 
@@ -414,6 +404,7 @@ public class {params['name']}_validation {{
 def generate_figure_reproduction_scripts(output_dir: Path):
     """Generate scripts to reproduce all manuscript figures."""
     print("📊 Generating figure reproduction scripts...")
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     figure_script = '''#!/usr/bin/env python3
 """
@@ -429,7 +420,6 @@ Usage:
 
 import numpy as np
 import matplotlib.pyplot as plt
-import json
 from pathlib import Path
 import argparse
 
@@ -437,13 +427,11 @@ import argparse
 def reproduce_figure_1_field_maps():
     """Reproduce Figure 1: Electromagnetic field maps."""
     # Load field data
-    with open('../simulation_data/field_maps.json', 'r') as f:
-        field_data = json.load(f)
-    
-    r_grid = np.array(field_data['coordinates']['r_grid'])
-    z_grid = np.array(field_data['coordinates']['z_grid'])
-    B_baseline = np.array(field_data['baseline_field'])
-    B_highfield = np.array(field_data['highfield_field'])
+    with np.load('../simulation_data/field_maps.npz') as field_data:
+        r_grid = field_data['r_grid']
+        z_grid = field_data['z_grid']
+        B_baseline = field_data['B_baseline']
+        B_highfield = field_data['B_highfield']
     
     # Calculate magnitudes
     B_mag_baseline = np.linalg.norm(B_baseline, axis=2)
@@ -526,8 +514,7 @@ if __name__ == '__main__':
     print(f"✅ Figures saved to {output_path}")
 '''
     
-    with open(output_dir / 'reproduce_figures.py', 'w') as f:
-        f.write(figure_script)
+    (output_dir / 'reproduce_figures.py').write_text(figure_script, encoding='utf-8', newline='\n')
     
     # Make script executable
     (output_dir / 'reproduce_figures.py').chmod(0o755)
@@ -545,14 +532,27 @@ def main():
     print(f"🚀 Exporting simulation data to {output_dir}")
     print("=" * 60)
     
-    # Generate all datasets
-    field_data = generate_field_maps(output_dir / 'simulation_data')
-    stress_data = generate_stress_data(output_dir / 'simulation_data') 
-    mc_data = generate_monte_carlo_data(output_dir / 'simulation_data', args.monte_carlo_samples)
-    thermal_data = generate_thermal_validation_data(output_dir / 'simulation_data')
-    
-    generate_comsol_inputs(output_dir / 'comsol_inputs')
-    generate_figure_reproduction_scripts(output_dir / 'figure_reproduction')
+    # One timestamp for every artifact in the package
+    now = time.localtime()
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S', now)
+    
+    # Generate all datasets; the generators share no data, so run them concurrently
+    sim_dir = output_dir / 'simulation_data'
+    jobs = {
+        'field_maps': (generate_field_maps, sim_dir, timestamp),
+        'stress': (generate_stress_data, sim_dir, timestamp),
+        'monte_carlo': (generate_monte_carlo_data, sim_dir, timestamp, args.monte_carlo_samples),
+        'thermal': (generate_thermal_validation_data, sim_dir, timestamp),
+        'comsol': (generate_comsol_inputs, output_dir / 'comsol_inputs'),
+        'figures': (generate_figure_reproduction_scripts, output_dir / 'figure_reproduction'),
+    }
+    datasets = {}
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+        futures = {executor.submit(fn, *fn_args): name for name, (fn, *fn_args) in jobs.items()}
+        for future in as_completed(futures):
+            datasets[futures[future]] = future.result()
+    stress_data = datasets['stress']
+    mc_data = datasets['monte_carlo']
     
     # Create README for data package
     readme_content = f"""# HTS Coil Optimization - Simulation Data Package
@@ -564,10 +564,11 @@ High-Field Applications in Fusion and Antimatter Trapping"
 ## Contents
 
 ### simulation_data/
-- `field_maps.json` - Complete electromagnetic field maps (50x40 grid)
-- `field_maps.npz` - Binary field data for efficient loading
+- `field_maps.json` - Field map descriptor (array shapes, units, configurations)
+- `field_maps.npz` - Electromagnetic field maps (50x40 grid) and coordinates
 - `stress_analysis.json` - Mechanical stress analysis results
-- `monte_carlo_analysis.json` - {args.monte_carlo_samples} sample sensitivity analysis
+- `monte_carlo_analysis.json` - Monte Carlo ranges, seed and feasibility summary (per-sample records moved to `monte_carlo_samples.npz`)
+- `monte_carlo_samples.npz` - {args.monte_carlo_samples} sample sensitivity analysis (columnar arrays)
 - `thermal_validation.json` - Thermal model validation data
 
 ### comsol_inputs/
@@ -608,7 +609,7 @@ High-Field Applications in Fusion and Antimatter Trapping"
 All data generated with deterministic parameters:
 - Random seed: 42 (Monte Carlo)
 - Grid resolution: Fixed at publication values
-- Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
+- Generated: {timestamp}
 
 ## Citation
 
@@ -619,14 +620,18 @@ When using this data, please cite the original manuscript and this data package.
 This data is provided under the same license as the accompanying software repository.
 """
     
-    with open(output_dir / 'README.md', 'w') as f:
-        f.write(readme_content)
+    (output_dir / 'README.md').write_text(readme_content, encoding='utf-8', newline='\n')
     
     # Create archive
     print("\n📦 Creating archive for Zenodo upload...")
-    import shutil
-    archive_name = f"hts_coil_data_{time.strftime('%Y%m%d')}"
-    shutil.make_archive(archive_name, 'zip', str(output_dir))
+    import zipfile
+    archive_name = f"hts_coil_data_{time.strftime('%Y%m%d', now)}"
+    with zipfile.ZipFile(f"{archive_name}.zip", 'w') as zf:
+        for path in sorted(output_dir.rglob('*')):
+            if path.is_file():
+                # NPZ/ZIP payloads are binary or already compressed; deflate only text
+                compress_type = zipfile.ZIP_STORED if path.suffix in {'.npz', '.zip'} else zipfile.ZIP_DEFLATED
+                zf.write(path, arcname=path.relative_to(output_dir), compress_type=compress_type)
     
     print(f"\n🎯 Data package complete!")
     print(f"   📁 Directory: {output_dir}")
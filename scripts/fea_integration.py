@@ -7,41 +7,78 @@ software with the HTS coil design and optimization workflow. Includes native
 open-source FEA implementation using FEniCSx as well as COMSOL/ANSYS interfaces.
 """
 from __future__ import annotations
+from array import array
 import numpy as np
 from pathlib import Path
+from functools import cached_property, lru_cache
+import importlib.util
 import json
 import sys
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import warnings
 
 # Add src directory to path for open-source FEA import
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-try:
-    from hts.fea import FEASolver, FEAResults
-    FEA_AVAILABLE = True
-except ImportError:
-    FEA_AVAILABLE = False
+def _module_available(name: str) -> bool:
+    """Whether ``name`` is importable, located without executing the module."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:  # missing parent package
+        return False
+
+# The solver modules pull in FEniCSx (PETSc/MPI) when imported, so only locate
+# them here and import on first use via _get_fea_solver_cls/_get_comsol_solver_cls
+FEA_AVAILABLE = _module_available("hts.fea")
+if not FEA_AVAILABLE:
     warnings.warn("Open-source FEA module not available")
 
 try:
-    from hts.comsol_fea import COMSOLFEASolver
-    COMSOL_AVAILABLE = True
+    import ijson
+    IJSON_AVAILABLE = True
 except ImportError:
-    COMSOL_AVAILABLE = False
+    IJSON_AVAILABLE = False
+
+# JSON result files larger than this are streamed when ijson is installed
+STREAM_JSON_MIN_BYTES = 64 * 1024 * 1024
+
+COMSOL_AVAILABLE = _module_available("hts.comsol_fea")
+if not COMSOL_AVAILABLE:
     warnings.warn("COMSOL FEA module not available")
 
+@lru_cache(maxsize=None)
+def _get_fea_solver_cls():
+    """Import the open-source FEASolver on first use."""
+    from hts.fea import FEASolver
+    return FEASolver
+
+@lru_cache(maxsize=None)
+def _get_comsol_solver_cls():
+    """Import COMSOLFEASolver on first use."""
+    from hts.comsol_fea import COMSOLFEASolver
+    return COMSOLFEASolver
+
+from hts import _json, _stress_numba  # type: ignore
+from hts._stress_numba import NUMBA_AVAILABLE  # type: ignore
+
 class FEAResults:
     """Container for FEA simulation results with unified interface."""
     
     def __init__(self, mesh_points: np.ndarray, stress_tensor: np.ndarray, 
                  displacement: np.ndarray, temperature: Optional[np.ndarray] = None,
-                 validation_error: Optional[float] = None):
+                 validation_error: Optional[float] = None, frame: str = "cylindrical",
+                 dtype: np.dtype = np.float32):
+        # Stress/displacement default to float32 (visualization grade, half the
+        # memory traffic); pass dtype=np.float64 for validation-critical results
         self.mesh_points = mesh_points  # [N, 3] array of (x,y,z) coordinates
-        self.stress_tensor = stress_tensor  # [N, 6] array of stress components
-        self.displacement = displacement  # [N, 3] array of displacements
+        self.stress_tensor = np.asarray(stress_tensor, dtype=dtype)  # [N, 6] array of stress components
+        self.displacement = np.asarray(displacement, dtype=dtype)  # [N, 3] array of displacements
         self.temperature = temperature  # [N,] array of temperatures
         self.validation_error = validation_error  # Validation error vs analytical
+        # "cylindrical": columns are [σrr, σθθ, σzz, ...] (pre-rotated)
+        # "cartesian": columns are Voigt [σxx, σyy, σzz, τxy, τxz, τyz]
+        self.frame = frame
+        self._cyl_cache = None
         
     @classmethod
     def from_fea(cls, fea_results: 'FEAResults') -> 'FEAResults':
@@ -68,40 +105,123 @@ class FEAResults:
             stress_tensor[:, 0] = fea_results.max_radial_stress  # Radial
             stress_tensor[:, 1] = fea_results.max_hoop_stress    # Hoop
             
-        displacement = np.zeros((n_points, 3))
         if fea_results.displacement_field is not None:
             # Reshape displacement field to match mesh
             disp_reshaped = fea_results.displacement_field.reshape(-1, mesh_points.shape[1])
-            displacement[:min(len(disp_reshaped), n_points)] = disp_reshaped[:n_points]
+            if disp_reshaped.shape == (n_points, 3):
+                displacement = disp_reshaped
+            else:
+                displacement = np.zeros((n_points, 3))
+                displacement[:min(len(disp_reshaped), n_points)] = disp_reshaped[:n_points]
+        else:
+            displacement = np.zeros((n_points, 3))
         
         return cls(mesh_points=mesh_points, stress_tensor=stress_tensor,
                    displacement=displacement,
-                   validation_error=fea_results.validation_error)
+                   validation_error=fea_results.validation_error, dtype=np.float64)
+        
+    def _to_cylindrical(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Radial and hoop stress at every mesh point, computed once and cached."""
+        if self._cyl_cache is None:
+            if self.frame == "cartesian":
+                theta = np.arctan2(self.mesh_points[:, 1], self.mesh_points[:, 0])
+                c = np.cos(theta)
+                s = np.sin(theta)
+                c2, s2, cs = c * c, s * s, c * s
+                sxx = self.stress_tensor[:, 0]
+                syy = self.stress_tensor[:, 1]
+                sxy = self.stress_tensor[:, 3]
+                sigma_rr = c2 * sxx + 2 * cs * sxy + s2 * syy
+                sigma_tt = s2 * sxx - 2 * cs * sxy + c2 * syy
+                self._cyl_cache = (sigma_rr, sigma_tt)
+            else:
+                self._cyl_cache = (self.stress_tensor[:, 0], self.stress_tensor[:, 1])
+        return self._cyl_cache
+        
+    def cylindrical_stress_tensor(self) -> np.ndarray:
+        """Full stress tensor in [σrr, σθθ, σzz, τrθ, τrz, τθz] Voigt order."""
+        if self.frame != "cartesian":
+            return self.stress_tensor
+        n = len(self.stress_tensor)
+        sxx, syy, szz, sxy, sxz, syz = self.stress_tensor[:, :6].T
+        S = np.empty((n, 3, 3))
+        S[:, 0, 0], S[:, 1, 1], S[:, 2, 2] = sxx, syy, szz
+        S[:, 0, 1] = S[:, 1, 0] = sxy
+        S[:, 0, 2] = S[:, 2, 0] = sxz
+        S[:, 1, 2] = S[:, 2, 1] = syz
+        
+        # Per-point rotation onto (e_r, e_θ, e_z); all points in one einsum
+        theta = np.arctan2(self.mesh_points[:, 1], self.mesh_points[:, 0])
+        c = np.cos(theta)
+        s = np.sin(theta)
+        Q = np.zeros((n, 3, 3))
+        Q[:, 0, 0], Q[:, 0, 1] = c, s
+        Q[:, 1, 0], Q[:, 1, 1] = -s, c
+        Q[:, 2, 2] = 1.0
+        S_cyl = np.einsum('nij,njk,nlk->nil', Q, S, Q, optimize=True)
+        
+        return np.column_stack([S_cyl[:, 0, 0], S_cyl[:, 1, 1], S_cyl[:, 2, 2],
+                                S_cyl[:, 0, 1], S_cyl[:, 0, 2], S_cyl[:, 1, 2]])
         
     @property
     def hoop_stress(self) -> np.ndarray:
         """Extract hoop stress component (circumferential stress)."""
-        # Assuming cylindrical coordinates: stress_tensor[:, 1] is hoop stress
-        return self.stress_tensor[:, 1]
+        return self._to_cylindrical()[1]
         
     @property
     def radial_stress(self) -> np.ndarray:
         """Extract radial stress component."""
-        # Assuming cylindrical coordinates: stress_tensor[:, 0] is radial stress
-        return self.stress_tensor[:, 0]
+        return self._to_cylindrical()[0]
         
-    @property
+    @staticmethod
+    def _max_abs(values: np.ndarray) -> float:
+        """max(|values|) without materializing an absolute-value temporary."""
+        return float(max(values.max(), -values.min()))
+        
+    @cached_property
     def max_hoop_stress(self) -> float:
         """Maximum hoop stress in the structure."""
-        return np.max(np.abs(self.hoop_stress))
+        return self._max_abs(self.hoop_stress)
         
-    @property
+    @cached_property
     def max_radial_stress(self) -> float:
         """Maximum radial stress in the structure."""
-        return np.max(np.abs(self.radial_stress))
+        return self._max_abs(self.radial_stress)
+    
+    @cached_property
+    def von_mises(self) -> np.ndarray:
+        """Von Mises equivalent stress at every mesh point (frame independent)."""
+        normal = self.stress_tensor[:, :3]
+        shear = self.stress_tensor[:, 3:6]
+        dev = normal - normal.mean(axis=1, keepdims=True)
+        # σ_vm² = 3/2 s:s over the deviatoric normals + 3 Σ τ²
+        return np.sqrt(1.5 * np.einsum('ij,ij->i', dev, dev)
+                       + 3.0 * np.einsum('ij,ij->i', shear, shear))
+        
+    def save_npz(self, path: Union[str, Path]) -> None:
+        """Save arrays in binary .npz form for fast reloads via from_npz."""
+        # Uncompressed: members load with a single read, no inflate step
+        np.savez(path, mesh_points=self.mesh_points, stress_tensor=self.stress_tensor,
+                 displacement=self.displacement,
+                 temperature=self.temperature if self.temperature is not None else np.empty(0),
+                 frame=np.array(self.frame))
+        
+    @classmethod
+    def from_npz(cls, path: Union[str, Path]) -> 'FEAResults':
+        """Load results written by save_npz, keeping the stored dtypes."""
+        with np.load(path) as data:
+            temperature = data['temperature']
+            return cls(data['mesh_points'], data['stress_tensor'], data['displacement'],
+                       temperature if temperature.size else None,
+                       frame=str(data['frame']), dtype=data['stress_tensor'].dtype)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        return dict(self.summary_dict)
+        
+    @cached_property
+    def summary_dict(self) -> Dict:
+        """Summary returned by to_dict(), computed once per result."""
         return {
             'max_hoop_stress_MPa': self.max_hoop_stress / 1e6,
             'max_radial_stress_MPa': self.max_radial_stress / 1e6,
@@ -109,6 +229,79 @@ class FEAResults:
             'mesh_points': len(self.mesh_points)
         }
 
+# Top-level arrays read by _stream_json_results: key -> (row width, dtype)
+_STREAM_JSON_ARRAYS = {
+    'mesh_points': (3, np.float64),
+    'stress_tensor': (6, np.float32),
+    'displacement': (3, np.float32),
+    'temperature': (1, np.float32),
+}
+
+class _StreamBuffer:
+    """Typed sink for one streamed array: a preallocated np.empty when the row count
+    is known up front, otherwise a compact growable array('d') of C doubles."""
+    
+    def __init__(self, width: int, dtype: np.dtype):
+        self.width = width
+        self.dtype = dtype
+        self.values = array('d')
+        self.out: Optional[np.ndarray] = None
+        self.count = 0
+        
+    def reserve(self, rows: int) -> None:
+        if not self.values:
+            self.out = np.empty(rows * self.width, dtype=self.dtype)
+        
+    def append(self, value: float) -> None:
+        if self.out is None:
+            self.values.append(value)
+            return
+        if self.count == self.out.size:
+            raise ValueError("JSON results hold more values than their 'n_points' header")
+        self.out[self.count] = value
+        self.count += 1
+        
+    def finish(self) -> np.ndarray:
+        if self.out is not None:
+            flat = self.out[:self.count]
+        else:
+            flat = np.frombuffer(self.values, dtype=np.float64).astype(self.dtype)
+        return flat.reshape(-1, self.width) if self.width > 1 else flat
+
+def _stream_json_results(results_file: Union[str, Path]) -> FEAResults:
+    """Load results with a single ijson pass, never building the JSON object graph.
+    
+    Every number is routed by its prefix straight into the buffer of its array.
+    An optional top-level ``n_points`` written before the arrays sizes the
+    buffers up front (np.empty); without it they grow as values arrive.
+    """
+    buffers = {key: _StreamBuffer(width, dtype) for key, (width, dtype) in _STREAM_JSON_ARRAYS.items()}
+    # Numbers sit at '<key>.item.item' in (n, width) arrays and '<key>.item' in flat ones
+    routes = {(f'{key}.item.item' if buf.width > 1 else f'{key}.item'): buf.append
+              for key, buf in buffers.items()}
+    with open(results_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if event != 'number':
+                continue
+            append = routes.get(prefix)
+            if append is not None:
+                append(value)
+            elif prefix == 'n_points':
+                for buf in buffers.values():
+                    buf.reserve(int(value))
+    
+    arrays = {key: buf.finish() for key, buf in buffers.items()}
+    temperature = arrays['temperature'] if arrays['temperature'].size else None
+    return FEAResults(arrays['mesh_points'], arrays['stress_tensor'], arrays['displacement'], temperature)
+
+def _frozen_results(mesh_points: np.ndarray, stress_tensor: np.ndarray) -> FEAResults:
+    """FEAResults with zero displacement and read-only arrays, safe to share."""
+    results = FEAResults(mesh_points, stress_tensor,
+                         np.zeros_like(mesh_points, dtype=np.float32))
+    for arr in (results.mesh_points, results.stress_tensor, results.displacement):
+        arr.setflags(write=False)
+    return results
+
 class FEAInterface:
     """Base class for FEA software interfaces."""
     
@@ -118,15 +311,150 @@ class FEAInterface:
         
     def run_analysis(self, coil_params: Dict, analysis_type: str = "static") -> FEAResults:
         """Run FEA analysis for given coil parameters."""
-        # Use analytical approximation as fallback
-        return self._analytical_approximation(coil_params)
+        key = self._cache_key(coil_params, analysis_type)
+        if key not in self.results_cache:
+            # Use analytical approximation as fallback
+            self.results_cache[key] = self._analytical_approximation(coil_params)
+        return self.results_cache[key]
+        
+    @staticmethod
+    def _cache_key(coil_params: Dict, analysis_type: str) -> tuple:
+        """Hashable key identifying an analysis in ``results_cache``.
+        
+        Parameters are serialized canonically (sorted by name, as compact JSON),
+        so unhashable values such as lists or arrays of layer radii still key
+        the cache; values JSON cannot encode fall back to their repr.
+        """
+        params = dict(sorted(coil_params.items(), key=lambda item: str(item[0])))
+        try:
+            canonical = _json.dumps(params, indent=False)
+        except TypeError:
+            canonical = repr(params).encode("utf-8")
+        return (analysis_type, canonical)
         
     def load_results(self, results_file: Union[str, Path]) -> FEAResults:
         """Load FEA results from file."""
-        if Path(results_file).exists() and Path(results_file).suffix == '.json':
-            return self._load_json_results(results_file)
+        path = Path(results_file)
+        # Suffix check first: it is a string compare, is_file() costs a stat()
+        if path.suffix == '.json' and path.is_file():
+            return self._load_json_results(path)
+        elif path.suffix == '.npz' and path.is_file():
+            return FEAResults.from_npz(path)
         else:
             return self._mock_results()
+        
+    # Analytical approximation settings: 0.1 mm REBCO tape, 20 tapes per turn
+    # (from previous analysis) on a reduced 10 x 18 (r, θ) visualization mesh
+    ANALYTICAL_TAPE_THICKNESS = 0.1e-3
+    ANALYTICAL_N_TAPES = 20
+    ANALYTICAL_MESH = (10, 18)
+        
+    def _analytical_approximation(self, coil_params: Dict) -> FEAResults:
+        """Fallback analytical approximation when FEA software unavailable."""
+        nr, ntheta = self.ANALYTICAL_MESH
+        return self._analytical_cached(
+            float(coil_params.get('N', 400)), float(coil_params.get('I', 1171)),
+            float(coil_params.get('R', 0.2)), self.ANALYTICAL_TAPE_THICKNESS,
+            self.ANALYTICAL_N_TAPES, nr, ntheta)
+        
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _analytical_cached(N: float, I: float, R: float, tape_thickness: float,
+                           n_tapes: int, nr: int, ntheta: int) -> FEAResults:
+        """Analytical approximation for one design, shared across calls and interfaces.
+        
+        The returned arrays are read-only since the same object is handed to
+        every caller asking for this design.
+        """
+        if NUMBA_AVAILABLE:
+            mesh_points, stress_tensor = _stress_numba.analytical_core(
+                N, I, R, nr, ntheta, tape_thickness, float(n_tapes))
+            return _frozen_results(mesh_points, stress_tensor)
+        
+        # Use validated analytical stress calculation from previous work
+        # Hoop stress: σ = B²R/(2μ₀t) where B is the field at conductor location
+        mu0 = 4e-7 * np.pi
+        
+        # For Helmholtz pair, field at conductor ≈ 0.9 × center field
+        B_center = mu0 * N * I / R  # Field at center
+        B_conductor = 0.9 * B_center  # Field at conductor location
+        
+        effective_thickness = n_tapes * tape_thickness
+        
+        # Validated hoop stress calculation
+        hoop_stress = B_conductor**2 * R / (2 * mu0 * effective_thickness)
+        radial_stress = hoop_stress * 0.05  # Radial stress ≈ 5% of hoop stress
+        
+        # Create simplified mesh for visualization
+        r_vals = np.linspace(R*0.95, R*1.05, nr)
+        theta_vals = np.linspace(0, 2*np.pi, ntheta)
+        
+        R_grid, T_grid = np.meshgrid(r_vals, theta_vals, indexing='ij')
+        x = (R_grid * np.cos(T_grid)).ravel()
+        y = (R_grid * np.sin(T_grid)).ravel()
+        mesh_points = np.column_stack([x, y, np.zeros_like(x)])
+        
+        # Uniform stress distribution (simplified)
+        # Store as [radial, hoop, axial, shear_xy, shear_yz, shear_xz]
+        stress_tensor = np.zeros((nr * ntheta, 6), dtype=np.float32)
+        stress_tensor[:, 0] = radial_stress
+        stress_tensor[:, 1] = hoop_stress
+        
+        return _frozen_results(mesh_points, stress_tensor)
+        
+    def analytical_batch(self, N: np.ndarray, I: np.ndarray, R: np.ndarray) -> List[FEAResults]:
+        """Analytical approximation for many (N, I, R) designs at once.
+        
+        With numba the whole batch is built in one parallel kernel; otherwise
+        each design goes through _analytical_approximation. Either way the
+        arrays are read-only, as for single designs.
+        """
+        Ns, Is, Rs = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64).ravel() for v in (N, I, R)))
+        if not NUMBA_AVAILABLE:
+            return [self._analytical_approximation({'N': n, 'I': i, 'R': r})
+                    for n, i, r in zip(Ns, Is, Rs)]
+        
+        nr, ntheta = self.ANALYTICAL_MESH
+        mesh_points, stress_tensor = _stress_numba.analytical_batch(
+            np.ascontiguousarray(Ns), np.ascontiguousarray(Is), np.ascontiguousarray(Rs),
+            nr, ntheta, self.ANALYTICAL_TAPE_THICKNESS, float(self.ANALYTICAL_N_TAPES))
+        return [_frozen_results(m, s) for m, s in zip(mesh_points, stress_tensor)]
+        
+    def _mock_results(self) -> FEAResults:
+        """Create mock FEA results for testing."""
+        # Simple 10x10 grid
+        x = np.linspace(-0.1, 0.1, 10)
+        y = np.linspace(-0.1, 0.1, 10)
+        
+        X, Y = np.meshgrid(x, y, indexing='ij')
+        mesh_points = np.column_stack([X.ravel(), Y.ravel(), np.zeros(X.size)])
+        
+        # Mock stress values: 50 MPa radial, 175 MPa hoop
+        stress_tensor = np.zeros((X.size, 6), dtype=np.float32)
+        stress_tensor[:, 0] = 50e6
+        stress_tensor[:, 1] = 175e6
+        displacement = np.zeros_like(mesh_points, dtype=np.float32)
+        
+        return FEAResults(mesh_points, stress_tensor, displacement)
+        
+    def _load_json_results(self, results_file: Union[str, Path]) -> FEAResults:
+        """Load results from JSON file format."""
+        # Large dumps are streamed to avoid holding the list-of-lists in memory;
+        # smaller files parse faster in one buffered read
+        if IJSON_AVAILABLE and Path(results_file).stat().st_size > STREAM_JSON_MIN_BYTES:
+            return _stream_json_results(results_file)
+        
+        # Parse from a single in-memory read rather than many small file reads
+        data = json.loads(Path(results_file).read_bytes())
+        
+        mesh_points = np.asarray(data['mesh_points'], dtype=np.float64)
+        stress_tensor = np.asarray(data['stress_tensor'], dtype=np.float32)
+        displacement = np.asarray(data['displacement'], dtype=np.float32)
+        temperature = data.get('temperature')
+        if temperature is not None:
+            temperature = np.asarray(temperature, dtype=np.float32)
+        
+        return FEAResults(mesh_points, stress_tensor, displacement, temperature)
 
 class COMSOLInterface(FEAInterface):
     """Interface for COMSOL Multiphysics FEA software."""
@@ -134,7 +462,7 @@ class COMSOLInterface(FEAInterface):
     def __init__(self):
         super().__init__("COMSOL")
         if COMSOL_AVAILABLE:
-            self.solver = COMSOLFEASolver()
+            self.solver = _get_comsol_solver_cls()()
         else:
             self.solver = None
             warnings.warn("COMSOL FEA not available")
@@ -188,6 +516,8 @@ class COMSOLInterface(FEAInterface):
         
         if Path(results_file).suffix == '.json':
             return self._load_json_results(results_file)
+        elif Path(results_file).suffix == '.npz':
+            return FEAResults.from_npz(results_file)
         else:
             warnings.warn(f"Cannot load COMSOL results from {results_file}")
             return self._mock_results()
@@ -217,6 +547,8 @@ class ANSYSInterface(FEAInterface):
         """Load ANSYS results from .rst file or exported data."""
         if Path(results_file).suffix == '.json':
             return self._load_json_results(results_file)
+        elif Path(results_file).suffix == '.npz':
+            return FEAResults.from_npz(results_file)
         else:
             warnings.warn(f"Cannot load ANSYS results from {results_file}")
             return self._mock_results()
@@ -227,15 +559,20 @@ class FEAInterface_FEniCS(FEAInterface):
     def __init__(self):
         super().__init__("FEniCS")
         if FEA_AVAILABLE:
-            self.solver = FEASolver()
+            self.solver = _get_fea_solver_cls()()
         else:
             self.solver = None
             warnings.warn("Open-source FEA not available. Install with: pip install -r requirements-fea.txt")
             
     def run_analysis(self, coil_params: Dict, analysis_type: str = "static") -> FEAResults:
         """Run open-source FEA analysis."""
+        key = self._cache_key(coil_params, analysis_type)
+        if key in self.results_cache:
+            return self.results_cache[key]
+        
         if self.solver is None:
-            return self._analytical_approximation(coil_params)
+            self.results_cache[key] = self._analytical_approximation(coil_params)
+            return self.results_cache[key]
             
         # Convert coil_params to format expected by FEASolver
         fea_params = {
@@ -251,7 +588,8 @@ class FEAInterface_FEniCS(FEAInterface):
         os_results = self.solver.compute_electromagnetic_stress(fea_params)
         
         # Convert to standard FEAResults format
-        return FEAResults.from_fea(os_results)
+        self.results_cache[key] = FEAResults.from_fea(os_results)
+        return self.results_cache[key]
     
     def _estimate_field_strength(self, coil_params: Dict) -> float:
         """Estimate magnetic field strength for stress analysis."""
@@ -279,13 +617,9 @@ def create_fea_interface(software: str = "auto") -> FEAInterface:
         elif FEA_AVAILABLE:
             print("🔧 Auto-detected FEniCSx (open-source)")
             return FEAInterface_FEniCS()
-        else:
-            try:
-                import ansys.mapdl.core
-                print("🔧 Auto-detected PyAnsys")
-                return ANSYSInterface()
-            except ImportError:
-                pass
+        elif _module_available("ansys.mapdl.core"):
+            print("🔧 Auto-detected PyAnsys")
+            return ANSYSInterface()
             
         warnings.warn("No FEA software detected. Using analytical approximations.")
         return FEAInterface()
@@ -314,93 +648,31 @@ def validate_fea_results(fea_results: FEAResults, analytical_results: Dict) -> D
         
     return validation
 
-# Helper methods for base class
-def _analytical_approximation(self, coil_params: Dict) -> FEAResults:
-    """Fallback analytical approximation when FEA software unavailable."""
-    N = coil_params.get('N', 400)
-    I = coil_params.get('I', 1171)  
-    R = coil_params.get('R', 0.2)
-    
-    # Use validated analytical stress calculation from previous work
-    # Hoop stress: σ = B²R/(2μ₀t) where B is the field at conductor location
-    mu0 = 4e-7 * np.pi
-    
-    # For Helmholtz pair, field at conductor ≈ 0.9 × center field
-    B_center = mu0 * N * I / R  # Field at center
-    B_conductor = 0.9 * B_center  # Field at conductor location
-    
-    tape_thickness = 0.1e-3  # 0.1mm REBCO tape
-    n_tapes = 20  # 20 tapes per turn from previous analysis
-    effective_thickness = n_tapes * tape_thickness
-    
-    # Validated hoop stress calculation
-    hoop_stress = B_conductor**2 * R / (2 * mu0 * effective_thickness)
-    radial_stress = hoop_stress * 0.05  # Radial stress ≈ 5% of hoop stress
-    
-    # Create simplified mesh for visualization
-    nr, ntheta = 10, 18  # Reduced mesh size
-    r_vals = np.linspace(R*0.95, R*1.05, nr)
-    theta_vals = np.linspace(0, 2*np.pi, ntheta)
-    
-    mesh_points = []
-    stress_tensor = []
-    
-    for r in r_vals:
-        for theta in theta_vals:
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)  
-            z = 0.0
-            mesh_points.append([x, y, z])
-            
-            # Uniform stress distribution (simplified)
-            # Store as [radial, hoop, axial, shear_xy, shear_yz, shear_xz]
-            stress_tensor.append([radial_stress, hoop_stress, 0, 0, 0, 0])
-    
-    mesh_points = np.array(mesh_points)
-    stress_tensor = np.array(stress_tensor)
-    displacement = np.zeros_like(mesh_points)
-    
-    return FEAResults(mesh_points, stress_tensor, displacement)
-
-def _mock_results(self) -> FEAResults:
-    """Create mock FEA results for testing."""
-    # Simple 10x10 grid
-    x = np.linspace(-0.1, 0.1, 10)
-    y = np.linspace(-0.1, 0.1, 10)
-    
-    mesh_points = []
-    stress_tensor = []
-    
-    for xi in x:
-        for yi in y:
-            mesh_points.append([xi, yi, 0.0])
-            # Mock stress values
-            stress_tensor.append([50e6, 175e6, 0, 0, 0, 0])  # 50 MPa radial, 175 MPa hoop
-    
-    mesh_points = np.array(mesh_points)
-    stress_tensor = np.array(stress_tensor)
-    displacement = np.zeros_like(mesh_points)
-    
-    return FEAResults(mesh_points, stress_tensor, displacement)
-
-def _load_json_results(self, results_file: Union[str, Path]) -> FEAResults:
-    """Load results from JSON file format."""
-    with open(results_file, 'r') as f:
-        data = json.load(f)
-    
-    mesh_points = np.array(data['mesh_points'])
-    stress_tensor = np.array(data['stress_tensor']) 
-    displacement = np.array(data['displacement'])
-    temperature = data.get('temperature')
-    if temperature:
-        temperature = np.array(temperature)
-    
-    return FEAResults(mesh_points, stress_tensor, displacement, temperature)
-
-# Monkey patch the helper methods to the base class
-FEAInterface._analytical_approximation = _analytical_approximation
-FEAInterface._mock_results = _mock_results  
-FEAInterface._load_json_results = _load_json_results
+def validate_fea_results_batch(fea_list: List[FEAResults],
+                               analytical_list: List[Dict]) -> Dict[str, np.ndarray]:
+    """Vectorized validate_fea_results over many candidates.
+    
+    Returns the same keys as validate_fea_results, each as an array over the
+    batch; error entries are NaN where the analytical reference is not > 0.
+    """
+    n = len(fea_list)
+    fea_hoop = np.fromiter((r.max_hoop_stress for r in fea_list), dtype=np.float64, count=n) / 1e6
+    fea_radial = np.fromiter((r.max_radial_stress for r in fea_list), dtype=np.float64, count=n) / 1e6
+    ana_hoop = np.fromiter((a.get('hoop_stress_MPa', 0) for a in analytical_list), dtype=np.float64, count=n)
+    ana_radial = np.fromiter((a.get('radial_stress_MPa', 0) for a in analytical_list), dtype=np.float64, count=n)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hoop_error = np.where(ana_hoop > 0, np.abs(fea_hoop - ana_hoop) / ana_hoop * 100, np.nan)
+        radial_error = np.where(ana_radial > 0, np.abs(fea_radial - ana_radial) / ana_radial * 100, np.nan)
+    
+    return {
+        'max_hoop_stress_MPa': fea_hoop,
+        'max_radial_stress_MPa': fea_radial,
+        'analytical_hoop_MPa': ana_hoop,
+        'analytical_radial_MPa': ana_radial,
+        'hoop_error_percent': hoop_error,
+        'radial_error_percent': radial_error,
+    }
 
 def main():
     """Example usage of FEA integration framework with open-source backend."""
@@ -2,8 +2,12 @@
 from __future__ import annotations
 from pathlib import Path
 import json
+import sys
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from hts import _json  # type: ignore
 
 def main():
     best_path = ROOT/"artifacts"/"best_config.json"
@@ -12,11 +16,14 @@ def main():
         print("best_config.json not found; run scripts/optimize_config.py first")
         return
     best = json.loads(best_path.read_text())
-    md = out_md.read_text() if out_md.exists() else "# How to reach 5 T\n\n"
-    md += "\n\nBest found configuration (auto):\n\n"
-    md += "```json\n" + json.dumps(best, indent=2) + "\n```\n"
-    out_md.write_text(md)
-    print(json.dumps({"status": "ok", "updated": str(out_md)}, indent=2))
+    # Append only the new block instead of re-reading and rewriting the whole file
+    with out_md.open("ab") as fh:
+        if fh.tell() == 0:
+            fh.write(b"# How to reach 5 T\n\n")
+        fh.write(b"\n\nBest found configuration (auto):\n\n```json\n")
+        fh.write(_json.dumps(best))
+        fh.write(b"\n```\n")
+    print(_json.dumps({"status": "ok", "updated": str(out_md)}).decode("utf-8"))
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,18 @@
 #!/usr/bin/env python3
 from pathlib import Path
-import json
 import sys
-import numpy as np
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from hts import sample_circular_coil_plane  # type: ignore
+from hts._cache import cached_sample_plane  # type: ignore
+from hts._kpi_numba import nan_mean_std  # type: ignore
+from hts import _json  # type: ignore
 
 
 def main() -> None:
-    X, Y, Bz = sample_circular_coil_plane(I=5000.0, N=100, R=1.0, extent=0.2, n=81)
-    mean = float(np.nanmean(Bz)); std = float(np.nanstd(Bz))
+    X, Y, Bz = cached_sample_plane(I=5000.0, N=100, R=1.0, extent=0.2, n=81)
+    mean, std = nan_mean_std(Bz)
     env = {
         "B_mean_T": mean,
         "B_std_T": std,
@@ -28,8 +28,9 @@ def main() -> None:
         }
     }
     (ROOT / "artifacts").mkdir(exist_ok=True)
-    (ROOT / "artifacts" / "operating_envelope.json").write_text(json.dumps(env, indent=2))
-    print(json.dumps(env, indent=2))
+    text = _json.dumps(env)
+    (ROOT / "artifacts" / "operating_envelope.json").write_bytes(text)
+    print(text.decode("utf-8"))
 
 
 if __name__ == "__main__":
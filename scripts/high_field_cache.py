@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk/in-process cache of the high-field scaling and space thermal results
+used by run_high_field_simulation.py and scripts/create_data_package.py.
+"""
+from __future__ import annotations
+import copy
+import hashlib
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from scripts.config_manager import CoilConfig, load_or_compute  # type: ignore
+
+# Anchored at the repo root so every working directory shares one cache
+HIGH_FIELD_CACHE_DIR = ROOT / ".cache" / "hts"
+
+# Bump when the cached result layout changes; edits to the model source
+# invalidate entries through the source digest in the key
+_SCHEMA_VERSION = 1
+_MODEL_SOURCE = ROOT / "src" / "hts" / "high_field_scaling.py"
+
+
+@lru_cache(maxsize=1)
+def _model_version() -> str:
+    digest = hashlib.blake2b(_MODEL_SOURCE.read_bytes(), digest_size=4).hexdigest()
+    return f"v{_SCHEMA_VERSION}_{digest}"
+
+
+@lru_cache(maxsize=None)
+def _high_field_results(N: int, I: float, R: float, T_op: float) -> dict:
+    def _compute(cfg: CoilConfig) -> dict:
+        from hts.high_field_scaling import scale_hts_coil_field, thermal_margin_space
+        field_result = scale_hts_coil_field(r=np.array([0, 0, 0]), N=cfg.N, I=cfg.I, R=cfg.R, T=T_op)
+        coil_params = {
+            'T': T_op,
+            'R': cfg.R,
+            'N': cfg.N,
+            'conductor_height': 0.004,  # 4mm tape height
+            'Q_AC': 0.92  # W, AC losses at 1mHz
+        }
+        thermal_result = thermal_margin_space(coil_params, T_env=4)
+        return {'field_scaling': field_result, 'thermal_analysis': thermal_result}
+
+    config = CoilConfig(geometry='single', N=int(N), I=float(I), R=float(R))
+    suffix = f'_highfield_{_model_version()}_T{T_op:g}'
+    return load_or_compute(config, HIGH_FIELD_CACHE_DIR, _compute, suffix=suffix)
+
+
+def high_field_results(N: int, I: float, R: float, T_op: float) -> dict:
+    """Field scaling and space thermal results, memoized in-process and on disk.
+    Returns a fresh copy, so callers may modify it without affecting the cache."""
+    return copy.deepcopy(_high_field_results(int(N), float(I), float(R), float(T_op)))
@@ -9,6 +9,7 @@ import numpy as np
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
+from hts import _json  # type: ignore
 from hts.coil import sample_circular_coil_plane, sample_helmholtz_pair_plane  # type: ignore
 from hts.config import load_config  # type: ignore
 
@@ -103,7 +104,7 @@ def main():
         print(json.dumps({"status": "no_feasible"}))
         return
 
-    args.out.write_text(json.dumps(best, indent=2))
+    _json.dump(best, args.out)
     print(json.dumps({"status": "ok", "best_path": str(args.out), "best": best}, indent=2))
 
 
@@ -80,19 +80,18 @@ def monte_carlo_tolerance(config: CoilConfig, tolerances: Dict[str, float],
 
 def perturb_config(config: CoilConfig, tolerances: Dict[str, float]) -> CoilConfig:
     """Create a perturbed version of config based on tolerances."""
-    import copy
-    perturbed = copy.deepcopy(config)
+    from dataclasses import replace
+    changes = {}
     
     for param, tol in tolerances.items():
-        if hasattr(perturbed, param):
-            current_val = getattr(perturbed, param)
+        if hasattr(config, param):
+            current_val = getattr(config, param)
             if isinstance(current_val, (int, float)):
                 # Add random perturbation
                 perturbation = np.random.normal(0, tol) * current_val
-                new_val = current_val + perturbation
-                setattr(perturbed, param, new_val)
+                changes[param] = current_val + perturbation
     
-    return perturbed
+    return replace(config, **changes)
 
 
 def get_field_for_config(config: CoilConfig, coords: np.ndarray = None) -> np.ndarray:
@@ -169,15 +168,13 @@ def sensitivity_analysis(config: CoilConfig, params: List[str],
         delta = delta_percent / 100.0 * current_val
         
         # Positive perturbation
-        import copy
-        config_plus = copy.deepcopy(config)
-        setattr(config_plus, param, current_val + delta)
+        from dataclasses import replace
+        config_plus = replace(config, **{param: current_val + delta})
         field_plus = get_field_for_config(config_plus, None)
         stats_plus = analyze_field_uniformity(field_plus, config_plus)
         
         # Negative perturbation
-        config_minus = copy.deepcopy(config)
-        setattr(config_minus, param, current_val - delta)
+        config_minus = replace(config, **{param: current_val - delta})
         field_minus = get_field_for_config(config_minus, None)
         stats_minus = analyze_field_uniformity(field_minus, config_minus)
         
@@ -9,6 +9,7 @@ import numpy as np
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
+from hts import _json  # type: ignore
 from hts.coil import (
     sample_circular_coil_plane,
     sample_helmholtz_pair_plane,
@@ -127,7 +128,7 @@ def main():
     candidates.sort(key=lambda r: (r["ripple_rms"], -r["B_mean_T"]))
     topk = candidates[:args.topk]
     top_path = ROOT/"artifacts"/"sweep_topk.json"
-    top_path.write_text(json.dumps({"config_hash": cfg_hash, "rows": topk}, indent=2))
+    _json.dump({"config_hash": cfg_hash, "rows": topk}, top_path)
     print(json.dumps({"total": len(rows), "candidates": len(candidates), "topk": len(topk), "config_hash": cfg_hash, "csv": str(args.out), "topk_json": str(top_path)}, indent=2))
 
     # Optional plots and comparison
@@ -192,7 +193,7 @@ def main():
                 "config_hash": cfg_hash,
                 "plots": plots_list,
             }
-            (ROOT/"artifacts"/"plots_manifest.json").write_text(json.dumps(manifest, indent=2))
+            _json.dump(manifest, ROOT/"artifacts"/"plots_manifest.json")
         except Exception as e:  # pragma: no cover
             print(f"[plots] skipped: {e}")
 
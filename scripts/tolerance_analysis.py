@@ -8,6 +8,7 @@ import numpy as np
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
+from hts import _json  # type: ignore
 from hts.coil import sample_plane_from_loops  # type: ignore
 
 
@@ -69,7 +70,7 @@ def main():
         "radius": R_results,
         "axial": Z_results,
     }
-    args.out.write_text(json.dumps(out, indent=2))
+    _json.dump(out, args.out)
     print(json.dumps({"status": "ok", "out": str(args.out)}, indent=2))
 
 
@@ -8,6 +8,7 @@ import numpy as np
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
+from hts import _json  # type: ignore
 from hts.coil import sample_plane_from_loops, sample_volume_from_loops, smear_loop_average, stack_layers_loops  # type: ignore
 from hts.config import load_config, cache_path_for  # type: ignore
 from hts.metrics import stored_magnetic_energy_grid, efficiency_hts_approx  # type: ignore
@@ -77,7 +78,7 @@ def main():
     kpi["stored_energy_J"] = float(U)
     kpi["hts_efficiency"] = float(eta)
     out = {"kpis": kpi, "assumptions": vars(args), "config_hash": cfg_hash}
-    (ROOT/"artifacts"/"volumetric_kpis.json").write_text(json.dumps(out, indent=2))
+    _json.dump(out, ROOT/"artifacts"/"volumetric_kpis.json")
     print(json.dumps(out, indent=2))
 
 
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Populate Numba's on-disk cache so later CLI runs load the compiled energy
+kernel instead of recompiling it. Intended as a CI step before running
+simulations; set NUMBA_CACHE_DIR to choose where the cache is kept.
+"""
+from __future__ import annotations
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from hts._field_numba import NUMBA_AVAILABLE, sum_b2_grid  # noqa: E402
+
+if not NUMBA_AVAILABLE:
+    print("numba not installed; nothing to warm up")
+else:
+    xs = np.linspace(-0.1, 0.1, 3)
+    t0 = time.perf_counter()
+    sum_b2_grid([(1.0, 1, 0.5, 0.0)], xs, xs, xs)  # compiles or loads the kernel
+    print(f"sum_b2_grid ready in {time.perf_counter() - t0:.2f} s")
@@ -0,0 +1,51 @@
+"""On-disk and in-process cache for sampled coil field planes.
+
+Several artifact scripts sample the same Bz plane; the first call computes it
+and writes artifacts/cache/<key>.npz, later calls (in any process) load it.
+The key includes the mtime of hts.coil so editing the field code invalidates
+stale entries.
+"""
+from __future__ import annotations
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from . import coil
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "artifacts" / "cache"
+
+
+def _cache_path(I: float, N: int, R: float, extent: float, n: int) -> Path:
+    source_mtime = os.stat(coil.__file__).st_mtime_ns
+    key = repr(("sample_circular_coil_plane", I, N, R, extent, n, source_mtime))
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+    return CACHE_DIR / f"bz_plane_{digest}.npz"
+
+
+@lru_cache(maxsize=32)
+def _cached_plane(I: float, N: int, R: float, extent: float, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    path = _cache_path(I, N, R, extent, n)
+    if path.exists():
+        with np.load(path, allow_pickle=False) as data:
+            X, Y, Bz = data["X"], data["Y"], data["Bz"]
+    else:
+        X, Y, Bz = coil.sample_circular_coil_plane(I=I, N=N, R=R, extent=extent, n=n)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent scripts never read a partial file
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, X=X, Y=Y, Bz=Bz)
+        os.replace(tmp, path)
+    for arr in (X, Y, Bz):
+        arr.setflags(write=False)  # shared between callers
+    return X, Y, Bz
+
+
+def cached_sample_plane(
+    I: float = 5000.0, N: int = 100, R: float = 1.0, extent: float = 0.5, n: int = 101
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cached sample_circular_coil_plane; returns read-only X, Y, Bz arrays."""
+    return _cached_plane(float(I), int(N), float(R), float(extent), int(n))
@@ -0,0 +1,46 @@
+"""JSON input/output for artifact and cache files, using orjson when it is installed."""
+from __future__ import annotations
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(o: Any) -> Any:
+    """Serialize numpy scalars/arrays and datetimes for the stdlib fallback encoder."""
+    if isinstance(o, (np.generic, np.ndarray)):
+        return o.tolist()
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()  # orjson emits the same RFC 3339 form natively
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """obj as UTF-8 JSON, 2-space indented or compact; numpy scalars/arrays are accepted."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    return text.encode("utf-8")
+
+
+def dump(obj: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """Write obj to path as JSON in a single buffered call."""
+    Path(path).write_bytes(dumps(obj, indent=indent))
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Read the JSON document at path."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
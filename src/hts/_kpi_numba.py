@@ -0,0 +1,60 @@
+"""Field-uniformity KPIs from a sampled B array in a single pass.
+
+Uses a numba kernel when numba is installed (the ``jit`` extra). Otherwise
+NaN-free arrays get both moments from one sum and one BLAS dot, and only
+arrays containing NaN fall back to np.nanmean / np.nanstd.
+"""
+from __future__ import annotations
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: its no-NaN assumption would drop the isnan skip below
+    @njit(cache=True)
+    def _nan_mean_std(flat):
+        """Welford mean and population std over the non-NaN entries of a 1-D array."""
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(flat.shape[0]):
+            x = flat[i]
+            if np.isnan(x):
+                continue
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        if count == 0:
+            return np.nan, np.nan
+        return mean, np.sqrt(m2 / count)
+
+
+def nan_mean_std(B: np.ndarray) -> Tuple[float, float]:
+    """(nanmean, nanstd) of B, reading the array once when numba is available."""
+    B = np.asarray(B, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        mean, std = _nan_mean_std(B.ravel())
+        return float(mean), float(std)
+    flat = B.ravel()
+    if flat.size == 0 or np.isnan(flat).any():
+        return float(np.nanmean(flat)), float(np.nanstd(flat))
+    # E[B^2] - E[B]^2: no temporaries; cancellation only matters for std/|mean| < ~1e-6
+    mean = flat.sum() / flat.size
+    var = np.dot(flat, flat) / flat.size - mean * mean
+    return float(mean), math.sqrt(max(var, 0.0))
+
+
+def kpis_from_B(B: np.ndarray) -> Dict[str, float]:
+    """Mean, std and RMS ripple (std/|mean|) of a sampled field array."""
+    mean, std = nan_mean_std(B)
+    ripple_rms = float(std / (abs(mean) + 1e-18))
+    return {"B_mean_T": mean, "B_std_T": std, "ripple_rms": ripple_rms}
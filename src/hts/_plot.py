@@ -0,0 +1,60 @@
+"""Shared two-panel Bz plot for the artifact scripts.
+
+The figure is created once per interpreter and cleared between calls, so
+repeated invocations skip Matplotlib's figure construction/teardown.
+"""
+from __future__ import annotations
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Checked without importing: matplotlib is only loaded on the first plot,
+# so KPI-only runs do not pay its import time and memory
+MPL_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+_FIG: Optional["Figure"] = None
+
+
+def twopanel_bz(
+    X: np.ndarray,
+    Y: np.ndarray,
+    Bz: np.ndarray,
+    out_centerline: Union[str, Path],
+    out_plane: Union[str, Path],
+    dpi: int = 150,
+) -> None:
+    """Plot the x=0 centerline and the z=0 plane of Bz and save to both paths."""
+    global _FIG
+    if not MPL_AVAILABLE:
+        raise RuntimeError("matplotlib is required for plotting (install the 'plot' extra)")
+    # A bare Figure (not pyplot) is never registered with the figure manager,
+    # so keeping it alive does not leak open windows/figures
+    if _FIG is None:
+        from matplotlib.figure import Figure
+        _FIG = Figure(figsize=(10, 4))
+    else:
+        _FIG.clf()
+    ax = _FIG.subplots(1, 2)
+
+    # float32 is plenty for rendering and halves the data Matplotlib copies
+    Bz = np.ascontiguousarray(Bz, dtype=np.float32)
+    mid = Bz.shape[1] // 2
+    ax[0].plot(Y[:, mid], Bz[:, mid])
+    ax[0].set_title("Bz centerline (x=0)")
+    ax[0].set_xlabel("y [m]")
+    ax[0].set_ylabel("Bz [T]")
+    ax[0].grid(True, alpha=0.3)
+
+    im = ax[1].imshow(Bz, extent=[X.min(), X.max(), Y.min(), Y.max()], origin="lower")
+    ax[1].set_title("Bz plane (z=0)")
+    ax[1].set_xlabel("x [m]")
+    ax[1].set_ylabel("y [m]")
+    _FIG.colorbar(im, ax=ax[1], shrink=0.9, label="Bz [T]")
+    _FIG.tight_layout()
+    _FIG.savefig(out_centerline, dpi=dpi)
+    _FIG.savefig(out_plane, dpi=dpi)
@@ -0,0 +1,61 @@
+"""Numba kernels for the analytical stress approximation in scripts/fea_integration.py.
+
+- analytical_core: (r, θ) mesh and uniform radial/hoop stress rows for one design.
+- analytical_batch: the same for many designs, one design per thread (prange).
+
+Kept in the package so numba's on-disk cache sees one stable module name
+however the calling script is imported. Callers check NUMBA_AVAILABLE and
+keep their NumPy path otherwise.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _analytical_fill(mesh_points, stress_tensor, N, I, R, nr, ntheta,
+                         tape_thickness, n_tapes):
+        """Fill one design's (r, θ) mesh and uniform stress rows in place."""
+        mu0 = 4e-7 * np.pi
+        B_conductor = 0.9 * mu0 * N * I / R
+        hoop_stress = B_conductor**2 * R / (2 * mu0 * n_tapes * tape_thickness)
+        radial_stress = hoop_stress * 0.05
+        dr = (R * 1.05 - R * 0.95) / (nr - 1)
+        dtheta = 2 * np.pi / (ntheta - 1)
+        for i in range(nr):
+            r = R * 0.95 + i * dr
+            for j in range(ntheta):
+                k = i * ntheta + j
+                mesh_points[k, 0] = r * np.cos(j * dtheta)
+                mesh_points[k, 1] = r * np.sin(j * dtheta)
+                mesh_points[k, 2] = 0.0
+                stress_tensor[k, 0] = radial_stress
+                stress_tensor[k, 1] = hoop_stress
+                for c in range(2, 6):
+                    stress_tensor[k, c] = 0.0
+
+    @njit(cache=True)
+    def analytical_core(N, I, R, nr, ntheta, tape_thickness, n_tapes):
+        """(mesh_points, stress_tensor) of the analytical approximation for one design."""
+        mesh_points = np.empty((nr * ntheta, 3))
+        stress_tensor = np.empty((nr * ntheta, 6), dtype=np.float32)
+        _analytical_fill(mesh_points, stress_tensor, N, I, R, nr, ntheta,
+                         tape_thickness, n_tapes)
+        return mesh_points, stress_tensor
+
+    @njit(parallel=True, cache=True)
+    def analytical_batch(Ns, Is, Rs, nr, ntheta, tape_thickness, n_tapes):
+        """Analytical meshes and stresses for many designs, one design per thread."""
+        n_designs = Ns.shape[0]
+        mesh_points = np.empty((n_designs, nr * ntheta, 3))
+        stress_tensor = np.empty((n_designs, nr * ntheta, 6), dtype=np.float32)
+        for d in prange(n_designs):
+            _analytical_fill(mesh_points[d], stress_tensor[d], Ns[d], Is[d], Rs[d],
+                             nr, ntheta, tape_thickness, n_tapes)
+        return mesh_points, stress_tensor
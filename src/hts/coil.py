@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 mu_0 = 4e-7 * np.pi  # Permeability of free space [H/m]
 from typing import Tuple, List, Sequence
 
@@ -32,21 +33,36 @@ def hts_coil_field(r: np.ndarray, I: float = 5000.0, N: int = 100, R: float = 1.
     return B
 
 
+@lru_cache(maxsize=16)
+def _plane_grid(extent: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Square X, Y meshgrid over [-extent, extent]^2; cached, so the arrays are read-only."""
+    xs = np.linspace(-extent, extent, n)
+    X, Y = np.meshgrid(xs, xs, indexing="xy")
+    X.setflags(write=False)
+    Y.setflags(write=False)
+    return X, Y
+
+
 def sample_circular_coil_plane(
     I: float = 5000.0, N: int = 100, R: float = 1.0, extent: float = 0.5, n: int = 101
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Sample Bz on the coil plane (z=0) over a square grid, return X, Y, Bz arrays.
     Used to calculate ripple statistics.
     """
-    xs = np.linspace(-extent, extent, n)
-    ys = np.linspace(-extent, extent, n)
-    X, Y = np.meshgrid(xs, ys, indexing="xy")
-    Bz = np.zeros_like(X)
-    for i in range(n):
-        for j in range(n):
-            B = hts_coil_field(np.array([X[i, j], Y[i, j], 0.0]), I=I, N=N, R=R)
-            Bz[i, j] = B[2]
-    return X, Y, Bz
+    X, Y = _plane_grid(float(extent), int(n))
+    try:
+        # N identical turns in the plane: closed form, O(grid)
+        return X, Y, N * loop_Bz_elliptic(I, R, X, Y)
+    except ImportError:  # no scipy: discretized Biot–Savart
+        return sample_plane_from_loops([(I, N, R, 0.0)], extent=extent, n=n)
+
+
+def loop_Bz_elliptic(I: float, R: float, X: np.ndarray, Y: np.ndarray, Z: np.ndarray | float = 0.0) -> np.ndarray:
+    """Exact Bz of a single-turn loop of radius R in the z=0 plane at points (X, Y, Z):
+    Bz = μ0 I/(2π) / √((R+ρ)²+z²) · [K(k) + (R²−ρ²−z²)/((R−ρ)²+z²) · E(k)],
+    k² = 4Rρ/((R+ρ)²+z²). Evaluated on whole arrays via loop_field_rz; requires scipy.
+    """
+    return loop_field_rz(np.hypot(X, Y), Z, [(I, 1, R, 0.0)])[1]
 
 
 def _loop_field_at(r: np.ndarray, I: float, N: int, R: float, z0: float = 0.0) -> np.ndarray:
@@ -65,16 +81,83 @@ def field_from_loops(r: np.ndarray, loops: Sequence[Tuple[float, int, float, flo
     return B
 
 
+def field_from_loops_batch(points: np.ndarray, loops: Sequence[Tuple[float, int, float, float]]) -> np.ndarray:
+    """Vectorized field_from_loops over many points.
+    points: (M, 3) array of positions; returns (M, 3) B vectors (Tesla).
+    Uses the same 360-segment Biot–Savart discretization as hts_coil_field.
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    theta = np.linspace(0.0, 2.0 * np.pi, 360, endpoint=False)
+    dtheta = 2.0 * np.pi / len(theta)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    B = np.zeros_like(pts)
+    for I, N, R, z0 in loops:
+        k = (mu_0 / (4.0 * np.pi)) * (I * N)
+        x, y, z = pts[:, 0], pts[:, 1], pts[:, 2] - z0
+        for c, s in zip(cos_t, sin_t):
+            # dl = R dθ (-sinθ, cosθ, 0); rp = r - loop_pos
+            dlx, dly = -R * dtheta * s, R * dtheta * c
+            rx, ry = x - R * c, y - R * s
+            rp_mag = np.sqrt(rx * rx + ry * ry + z * z)
+            with np.errstate(divide="ignore"):
+                w = np.where(rp_mag > 1e-9, k / rp_mag ** 3, 0.0)
+            B[:, 0] += w * (dly * z)
+            B[:, 1] += w * (-dlx * z)
+            B[:, 2] += w * (dlx * ry - dly * rx)
+    return B
+
+
+def loop_field_rz(
+    rho: np.ndarray, z: np.ndarray, loops: Sequence[Tuple[float, int, float, float]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact (B_rho, B_z) of coaxial circular loops from complete elliptic integrals.
+    rho, z: broadcastable cylindrical coordinates (m); loops: sequence of (I, N, R, z0).
+    Loop parameters may also be arrays broadcasting against rho, z. Returns arrays of
+    the broadcast shape (Tesla). Requires scipy. Points lying exactly on a winding get
+    no contribution from it, as in the Biot–Savart samplers.
+    """
+    from scipy.special import ellipk, ellipe
+
+    rho = np.asarray(rho, dtype=float)
+    z = np.asarray(z, dtype=float)
+    shape = np.broadcast_shapes(rho.shape, z.shape)
+    Brho = np.zeros(shape)
+    Bz = np.zeros(shape)
+    for I, N, R, z0 in loops:
+        dz = z - z0
+        s = R * R + rho * rho + dz * dz
+        alpha2 = s - 2.0 * R * rho
+        beta2 = s + 2.0 * R * rho
+        beta = np.sqrt(beta2)
+        m = 1.0 - alpha2 / beta2  # k²
+        K = ellipk(m)
+        E = ellipe(m)
+        C = mu_0 * I * N / np.pi
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bz = C / (2.0 * alpha2 * beta) * ((R * R - rho * rho - dz * dz) * E + alpha2 * K)
+            br = C * dz / (2.0 * alpha2 * beta * rho) * (s * E - alpha2 * K)
+        off_wire = alpha2 > 0.0
+        Bz = Bz + np.where(off_wire, bz, 0.0)
+        Brho = Brho + np.where(off_wire & (rho > 0.0), br, 0.0)
+    return Brho, Bz
+
+
 def sample_plane_from_loops(
     loops: Sequence[Tuple[float, int, float, float]], extent: float = 0.5, n: int = 101, z_plane: float = 0.0
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    xs = np.linspace(-extent, extent, n)
-    ys = np.linspace(-extent, extent, n)
-    X, Y = np.meshgrid(xs, ys, indexing="xy")
+    X, Y = _plane_grid(float(extent), int(n))
+    from ._field_numba import NUMBA_AVAILABLE, bz_plane_nwire
+    if NUMBA_AVAILABLE:
+        # Same discretization, all grid rows in parallel
+        return X, Y, bz_plane_nwire(X[0], Y[:, 0], z_plane, loops)
     Bz = np.zeros_like(X)
+    pt = np.empty(3, dtype=np.float64)  # reused point buffer; field_from_loops keeps no reference
+    pt[2] = z_plane
     for i in range(n):
         for j in range(n):
-            B = field_from_loops(np.array([X[i, j], Y[i, j], z_plane]), loops)
+            pt[0] = X[i, j]
+            pt[1] = Y[i, j]
+            B = field_from_loops(pt, loops)
             Bz[i, j] = B[2]
     return X, Y, Bz
 
@@ -92,6 +175,20 @@ def sample_helmholtz_pair_plane(
     return sample_plane_from_loops(loops, extent=extent, n=n, z_plane=0.0)
 
 
+def sample_helmholtz_pair_plane_analytic(
+    I: float, N: int, R: float, separation: float | None = None, extent: float = 0.5, n: int = 101
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Closed-form counterpart of sample_helmholtz_pair_plane (same grid and arguments).
+    The mid-plane is equidistant from both loops, so Bz is twice the exact single-loop
+    field at axial offset separation/2: one elliptic-integral pass, O(grid). Requires scipy.
+    """
+    if separation is None:
+        separation = R
+    X, Y = _plane_grid(float(extent), int(n))
+    Bz = 2.0 * loop_field_rz(np.hypot(X, Y), separation / 2.0, [(I, N, R, 0.0)])[1]
+    return X, Y, Bz
+
+
 def sample_stack_plane(
     I: float, N: int, R: float, layers: int, axial_spacing: float, extent: float = 0.5, n: int = 101
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -118,10 +215,14 @@ def sample_volume_from_loops(
     zs = np.linspace(-z_extent, z_extent, nz)
     X, Y, Z = np.meshgrid(xs, ys, zs, indexing="xy")
     Bmag = np.zeros_like(X)
+    pt = np.empty(3, dtype=np.float64)  # reused point buffer; field_from_loops keeps no reference
     for ix in range(n):
         for iy in range(n):
             for iz in range(nz):
-                B = field_from_loops(np.array([X[ix, iy, iz], Y[ix, iy, iz], Z[ix, iy, iz]]), loops)
+                pt[0] = X[ix, iy, iz]
+                pt[1] = Y[ix, iy, iz]
+                pt[2] = Z[ix, iy, iz]
+                B = field_from_loops(pt, loops)
                 Bmag[ix, iy, iz] = np.linalg.norm(B)
     return X, Y, Z, Bmag
 
@@ -13,6 +13,9 @@ import warnings
 from .coil import hts_coil_field, field_from_loops
 from .materials import jc_vs_tb, enhanced_thermal_simulation
 
+# Kim-model J_c(T, B) parameters shared by the scalar and batch field scaling
+JC_MODEL = {'Tc': 90.0, 'Jc0': 300e6, 'B0': 5.0, 'n': 1.5}
+
 
 def scale_hts_coil_field(r: np.ndarray, I: float = 1800, N: int = 1000, R: float = 0.16, T: float = 15) -> Dict[str, float]:
     """
@@ -43,7 +46,7 @@ def scale_hts_coil_field(r: np.ndarray, I: float = 1800, N: int = 1000, R: float
     B_z = B_vec[2]  # On-axis component
     
     # Kim model critical current density
-    J_c = jc_vs_tb(T=T, B=B_magnitude, Tc=90.0, Jc0=300e6, B0=5.0, n=1.5)  # A/m²
+    J_c = jc_vs_tb(T=T, B=B_magnitude, **JC_MODEL)  # A/m²
     
     # Realistic tape stack design for high current
     tape_width = 4e-3  # m (4mm standard REBCO tape)
@@ -81,6 +84,63 @@ def scale_hts_coil_field(r: np.ndarray, I: float = 1800, N: int = 1000, R: float
     }
 
 
+def scale_hts_coil_field_batch(I: np.ndarray, N: np.ndarray, R: np.ndarray, T: np.ndarray,
+                               r: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Vectorized scale_hts_coil_field over arrays of (I, N, R, T) evaluated at one point r
+    (default: the coil center).
+    
+    Same model and thresholds as the scalar version; the field comes from the
+    closed-form loop field (hts.coil.loop_field_rz, requires scipy) so all samples
+    are evaluated in one pass.
+    
+    Returns:
+    --------
+    result : Dict[str, np.ndarray]
+        The keys of scale_hts_coil_field, each an array over the samples
+    """
+    from .coil import loop_field_rz
+    
+    I, N, R, T = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (I, N, R, T)))
+    x, y, z = np.zeros(3) if r is None else np.asarray(r, dtype=float)
+    rho = np.hypot(x, y)
+    B_rho, B_z = loop_field_rz(rho, z, [(I, N, R, 0.0)])
+    B_magnitude = np.hypot(B_rho, B_z)
+    
+    # Kim model critical current density
+    J_c = jc_vs_tb(T=T, B=B_magnitude, **JC_MODEL)
+    
+    tape_width = 4e-3  # m
+    tape_thickness = 0.2e-3  # m
+    I_max_single_tape = J_c * tape_width * tape_thickness
+    with np.errstate(divide='ignore'):
+        tapes_per_turn = np.maximum(1, np.ceil(I / (0.3 * I_max_single_tape))).astype(int)
+    effective_thickness = tape_thickness * tapes_per_turn
+    I_max = I_max_single_tape * tapes_per_turn
+    
+    ripple = np.minimum(0.001 * (0.2 / R) ** 2, 0.1)
+    
+    with np.errstate(divide='ignore'):
+        current_utilization = np.where(I_max > 0, I / I_max, np.inf)
+    thermal_feasible = T < 80
+    field_feasible = (current_utilization <= 0.35) & (ripple < 0.01)
+    
+    return {
+        'B_magnitude': B_magnitude,
+        'B_z': B_z,
+        'ripple': ripple,
+        'J_c': J_c,
+        'I_max': I_max,
+        'current_utilization': current_utilization,
+        'field_feasible': field_feasible,
+        'thermal_feasible': thermal_feasible,
+        'temperature': T,
+        'tapes_per_turn': tapes_per_turn,
+        'effective_thickness': effective_thickness,
+        'I_max_single_tape': I_max_single_tape
+    }
+
+
 def compute_field_ripple(B_vec: np.ndarray, R: float) -> float:
     """
     Compute field ripple estimate.
@@ -117,6 +177,7 @@ def thermal_margin_space(coil_params: Dict[str, float], T_env: float = 4,
     -----------
     coil_params : Dict[str, float]
         Coil parameters including surface area and operating temperature
+        (optional 'emissivity', default 0.1)
     T_env : float
         Environment temperature (K, default: 4 for space-like)
     cryocooler_power : float
@@ -143,7 +204,7 @@ def thermal_margin_space(coil_params: Dict[str, float], T_env: float = 4,
     
     # Stefan-Boltzmann radiative heat transfer in vacuum
     sigma_sb = 5.67e-8  # W/(m²·K⁴)
-    emissivity = 0.1  # Typical for polished metal surfaces (conservative)
+    emissivity = coil_params.get('emissivity', 0.1)  # 0.1: polished metal surfaces (conservative)
     
     Q_rad = sigma_sb * emissivity * surface_area * (T_op**4 - T_env**4)
     
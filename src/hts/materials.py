@@ -3,21 +3,30 @@ import math
 from dataclasses import dataclass
 from typing import Optional, Dict
 
+import numpy as np
+
 # Simplified Ginzburg–Landau style temperature dependence for J_c(T)
 # J_c(T) = J_c0 * (1 - T/Tc)^(3/2)
+def _scalar_or_array(x: np.ndarray):
+    """Python float for 0-d results (scalar callers keep float returns), else the array."""
+    return float(x) if np.ndim(x) == 0 else x
+
+
+# T may be an array (elementwise); scalar T gives a float
 def jc_vs_temperature(T: float, Tc: float, Jc0: float) -> float:
     if Tc <= 0:
         raise ValueError("Tc must be > 0")
-    x = max(0.0, 1.0 - T / Tc)
-    return Jc0 * (x ** 1.5)
+    x = np.maximum(0.0, 1.0 - np.asarray(T, dtype=float) / Tc)
+    return _scalar_or_array(Jc0 * x ** 1.5)
 
 
 # Very simple magnetic-field derating model: J_c(T,B) = J_c(T) / (1 + (B/B0)^n)
+# T and B may be arrays (broadcast elementwise); B <= 0 applies no field derating
 def jc_vs_tb(T: float, B: float, Tc: float, Jc0: float, B0: float = 5.0, n: float = 1.5) -> float:
     base = jc_vs_temperature(T, Tc, Jc0)
-    if B <= 0:
-        return base
-    return base / (1.0 + (B / max(1e-12, B0)) ** max(0.0, n))
+    B = np.asarray(B, dtype=float)
+    derate = 1.0 + (np.maximum(B, 0.0) / max(1e-12, B0)) ** max(0.0, n)
+    return _scalar_or_array(np.where(B > 0, base / derate, base))
 
 
 @dataclass
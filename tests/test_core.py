@@ -1,10 +1,15 @@
 import json
+import sys
 import numpy as np
+import pytest
 from pathlib import Path
-from hts.coil import mu_0, hts_coil_field, sample_helmholtz_pair_plane, sample_stack_plane
+from hts.coil import mu_0, hts_coil_field, sample_helmholtz_pair_plane, sample_helmholtz_pair_plane_analytic, sample_stack_plane
+from hts.coil import field_from_loops, field_from_loops_batch, loop_field_rz
 from hts import sample_circular_coil_plane
 from hts.materials import jc_vs_temperature
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
 
 def test_analytic_center_field():
     N,I,R=100,5000.0,1.0
@@ -42,3 +47,177 @@ def test_helmholtz_symmetry():
 def test_stack_plane_defined():
     X,Y,Bz=sample_stack_plane(I=5000.0,N=50,R=0.5,layers=3,axial_spacing=0.1,extent=0.2,n=21)
     assert np.isfinite(Bz).all()
+
+
+def test_field_from_loops_batch_matches_pointwise():
+    loops=[(5000.0,100,0.5,-0.1),(5000.0,100,0.5,0.1)]
+    pts=np.array([[0.0,0.0,0.0],[0.1,-0.2,0.05],[0.3,0.1,-0.2]])
+    Bb=field_from_loops_batch(pts,loops)
+    Bp=np.array([field_from_loops(p,loops) for p in pts])
+    assert np.allclose(Bb,Bp,rtol=1e-12,atol=1e-12)
+
+
+def test_loop_field_rz_matches_biot_savart():
+    loops=[(5000.0,100,0.5,-0.1),(2000.0,50,0.3,0.2)]
+    pts=np.array([[0.1,-0.2,0.05],[0.3,0.1,-0.2],[0.0,0.0,0.4]])
+    rho=np.hypot(pts[:,0],pts[:,1])
+    Brho,Bz=loop_field_rz(rho,pts[:,2],loops)
+    c=np.divide(pts[:,:2],rho[:,None],out=np.zeros((3,2)),where=rho[:,None]>0)
+    B=np.column_stack([Brho*c[:,0],Brho*c[:,1],Bz])
+    assert np.allclose(B,field_from_loops_batch(pts,loops),rtol=1e-9,atol=1e-12)
+
+
+def test_circular_plane_matches_biot_savart():
+    X,Y,Bz=sample_circular_coil_plane(I=5000.0,N=100,R=1.0,extent=0.5,n=5)
+    ref=np.array([hts_coil_field(np.array([x,y,0.0]))[2] for x,y in zip(X.ravel(),Y.ravel())])
+    assert np.allclose(Bz.ravel(),ref,rtol=1e-9)
+
+
+def test_helmholtz_plane_analytic_matches_loop_sum():
+    for sep in (None,0.15):
+        _,_,ref=sample_helmholtz_pair_plane(1171.0,400,0.2,separation=sep,extent=0.3,n=7)
+        _,_,Bz=sample_helmholtz_pair_plane_analytic(1171.0,400,0.2,separation=sep,extent=0.3,n=7)
+        assert np.allclose(Bz,ref,rtol=1e-6)
+
+
+def test_plane_from_loops_matches_batch_field():
+    from hts.coil import sample_plane_from_loops
+    loops=[(1171.0,400,0.2,-0.1),(800.0,200,0.25,0.05)]
+    X,Y,Bz=sample_plane_from_loops(loops,extent=0.3,n=9,z_plane=0.02)
+    pts=np.column_stack([X.ravel(),Y.ravel(),np.full(X.size,0.02)])
+    assert np.allclose(Bz.ravel(),field_from_loops_batch(pts,loops)[:,2],rtol=1e-9)
+
+
+def test_nan_mean_std_numpy_fallback(monkeypatch):
+    from hts import _kpi_numba
+    monkeypatch.setattr(_kpi_numba,"NUMBA_AVAILABLE",False)
+    B=np.random.default_rng(0).normal(5.0,0.01,(41,41))
+    assert np.allclose(_kpi_numba.nan_mean_std(B),(B.mean(),B.std()),rtol=1e-9)
+    B[3,4]=np.nan
+    assert np.allclose(_kpi_numba.nan_mean_std(B),(np.nanmean(B),np.nanstd(B)),rtol=1e-12)
+
+
+def test_scale_hts_coil_field_batch_matches_scalar():
+    from hts.high_field_scaling import scale_hts_coil_field, scale_hts_coil_field_batch
+    N=np.array([400,1000]);I=np.array([1171.0,1800.0]);R=np.array([0.2,0.16]);T=np.array([20.0,15.0])
+    b=scale_hts_coil_field_batch(I,N,R,T)
+    for i in range(2):
+        s=scale_hts_coil_field(np.zeros(3),N=int(N[i]),I=I[i],R=R[i],T=T[i])
+        for k in ('B_magnitude','J_c','current_utilization','tapes_per_turn','ripple','field_feasible'):
+            assert np.isclose(b[k][i],s[k],rtol=1e-9)
+
+
+def test_energy_kernel_matches_field_from_loops():
+    from hts import _field_numba as fn
+    if not fn.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    loops=[(1171.0,400,0.2,-0.1),(800.0,200,0.25,0.05)]
+    xs=np.linspace(-0.1,0.1,4)
+    ref=sum(np.sum(field_from_loops(np.array([x,y,z]),loops)**2) for x in xs for y in xs for z in xs)
+    assert np.isclose(fn.sum_b2_grid(loops,xs,xs,xs),ref,rtol=1e-9)
+
+
+def test_energy_kernel_compiled_once():
+    from hts import _field_numba as fn
+    if not fn.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    xs=np.linspace(-0.1,0.1,3)
+    fn.sum_b2_grid([(1171,400,0.2,0)],xs,xs,xs)  # int loop values
+    fn.sum_b2_grid(np.array([[1171.0,400.0,0.2,0.0]]),xs[::-1].copy()[::-1],xs,xs)  # strided grid
+    assert len(fn._sum_b2.signatures)==1
+
+
+def test_stored_energy_midpoint_same_with_and_without_numba(monkeypatch):
+    import energy_efficiency as ee
+    loops=[(1171.0,400,0.2,0.0)]  # default 41³ grid has points next to the winding
+    U=ee.estimate_stored_energy(loops)
+    monkeypatch.setattr(ee,"NUMBA_AVAILABLE",False)
+    assert np.isclose(ee.estimate_stored_energy(loops),U,rtol=1e-9)
+
+
+def test_stored_energy_orders_agree():
+    import energy_efficiency as ee
+    loops=[(5000.0,100,1.0,-0.25),(5000.0,100,1.0,0.25)]  # box excludes the windings
+    ref=ee.estimate_stored_energy(loops,volume_extent=0.3,n_samples=8,order="gauss")
+    assert np.isclose(ee.estimate_stored_energy(loops,volume_extent=0.3,n_samples=15,order="simpson"),ref,rtol=1e-5)
+    assert np.isclose(ee.estimate_stored_energy(loops,volume_extent=0.3,n_samples=16,method="axisym"),ref,rtol=1e-4)
+    assert np.isclose(ee.estimate_stored_energy(loops,volume_extent=0.3,n_samples=41),ref,rtol=1e-3)
+
+
+def test_jc_vs_tb_array_matches_scalar():
+    from hts.materials import jc_vs_tb
+    T=np.array([4.0,20.0,77.0,95.0]);B=np.array([0.0,7.0,-1.0,3.0])
+    Jc=jc_vs_tb(T,B,Tc=90.0,Jc0=300e6)
+    assert np.allclose(Jc,[jc_vs_tb(t,b,Tc=90.0,Jc0=300e6) for t,b in zip(T,B)],rtol=1e-12)
+    assert isinstance(jc_vs_tb(20.0,7.0,Tc=90.0,Jc0=300e6),float)
+
+
+def test_stream_json_results_matches_json_load(tmp_path):
+    fea=pytest.importorskip("fea_integration")
+    if not fea.IJSON_AVAILABLE:
+        pytest.skip("ijson not installed")
+    rng=np.random.default_rng(0)
+    data={'mesh_points':rng.random((7,3)).tolist(),'stress_tensor':rng.random((7,6)).tolist(),
+          'displacement':rng.random((7,3)).tolist(),'temperature':rng.random(7).tolist()}
+    for header in ({},{'n_points':7}):
+        path=tmp_path/"res.json"
+        path.write_text(json.dumps({**header,**data}))
+        ref=fea.FEAInterface()._load_json_results(path)  # small file: buffered json.loads path
+        res=fea._stream_json_results(path)
+        for name in ('mesh_points','stress_tensor','displacement','temperature'):
+            assert np.array_equal(getattr(res,name),getattr(ref,name))
+            assert getattr(res,name).dtype==getattr(ref,name).dtype
+
+
+def test_fea_results_npz_round_trip(tmp_path):
+    fea=pytest.importorskip("fea_integration")
+    res=fea.FEAInterface()._analytical_approximation({'N':400,'I':1171.0,'R':0.2})
+    res.save_npz(tmp_path/"res.npz")
+    back=fea.FEAResults.from_npz(tmp_path/"res.npz")
+    for name in ('mesh_points','stress_tensor','displacement'):
+        assert np.array_equal(getattr(back,name),getattr(res,name))
+        assert getattr(back,name).dtype==getattr(res,name).dtype
+    assert back.temperature is None and back.frame==res.frame
+    assert back.max_hoop_stress==res.max_hoop_stress
+
+
+def test_run_analysis_cache_accepts_unhashable_params():
+    fea=pytest.importorskip("fea_integration")
+    iface=fea.FEAInterface()
+    params={'N':400,'I':1171.0,'R':0.2,'layer_radii':np.array([0.2,0.21]),'currents':[1171.0,1171.0]}
+    res=iface.run_analysis(params)
+    assert iface.run_analysis(dict(reversed(list(params.items())))) is res
+    iface.run_analysis({**params,'layer_radii':np.array([0.2,0.22])})
+    assert len(iface.results_cache)==2  # array contents are part of the key
+
+
+def test_analytical_results_read_only_on_every_path(monkeypatch):
+    fea=pytest.importorskip("fea_integration")
+    iface=fea.FEAInterface()
+    single=iface._analytical_approximation({'N':400,'I':1171.0,'R':0.2})
+    assert iface._analytical_approximation({'N':400,'I':1171.0,'R':0.2}) is single  # memoized
+    batches=[iface.analytical_batch([400],[1171.0],[0.2])]
+    monkeypatch.setattr(fea,"NUMBA_AVAILABLE",False)
+    batches.append(iface.analytical_batch([400],[1171.0],[0.2]))
+    for (res,) in batches:
+        assert np.array_equal(res.stress_tensor,single.stress_tensor)
+        for r in (res,single):
+            assert not r.stress_tensor.flags.writeable and not r.mesh_points.flags.writeable
+
+
+def test_validation_results_cached_by_config(tmp_path, monkeypatch):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    import experimental_validation_framework as evf
+    cfg=evf.ExperimentalConfig()
+    assert evf.LentzSolitonValidator(cfg).cache_dir is None  # opt-in: nothing written by default
+    first=evf.LentzSolitonValidator(cfg,cache_dir=tmp_path).run_experimental_validation()
+    assert (tmp_path/f"{evf.config_hash(cfg)}.json").exists()
+    def fail(self):
+        raise AssertionError("cache hit must not rerun the validators")
+    monkeypatch.setattr(evf.LentzSolitonValidator,"validate_plasma_configuration",fail)
+    again=evf.LentzSolitonValidator(cfg,cache_dir=tmp_path).run_experimental_validation()
+    assert again==json.loads(json.dumps(first,default=lambda o: o.tolist()))
+    assert evf.config_hash(evf.ExperimentalConfig(coil_radius=cfg.coil_radius*2))!=evf.config_hash(cfg)
+    h=evf.config_hash(cfg)
+    monkeypatch.setattr(evf,"_SCHEMA_VERSION",evf._SCHEMA_VERSION+1)
+    assert evf.config_hash(cfg)!=h  # layout changes invalidate old entries